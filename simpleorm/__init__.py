@@ -13,21 +13,43 @@ Example::
     user.insert(db_conn=db)
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
-from simpleorm.base_model import (
-    BaseTableModel,
-    Column,
-    ColumnMetadata,
-    OnDeleteFkEnum,
-)
-from simpleorm.db_util import DbUtil
+# PEP 562 lazy loading: submodules are imported on first attribute access,
+# so e.g. scripts that only use DbUtil never pay base_model's Pydantic
+# import cost at `import simpleorm` time.
+_LAZY_IMPORTS = {
+    "BaseTableModel": "simpleorm.base_model",
+    "Column": "simpleorm.base_model",
+    "ColumnMetadata": "simpleorm.base_model",
+    "OnDeleteFkEnum": "simpleorm.base_model",
+    "DbUtil": "simpleorm.db_util",
+    "AsyncDbUtil": "simpleorm.async_db_util",
+    "PsycopgDbUtil": "simpleorm.db_util_psycopg",
+}
 
 __all__ = [
     "DbUtil",
+    "AsyncDbUtil",
+    "PsycopgDbUtil",
     "BaseTableModel",
     "Column",
     "ColumnMetadata",
     "OnDeleteFkEnum",
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'simpleorm' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so later accesses skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(list(globals()) + __all__))
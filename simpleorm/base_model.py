@@ -8,21 +8,206 @@ for connections; model methods accept an optional ``db_conn`` or create one
 from environment variables.
 """
 
+import contextlib
 import datetime
-import json
+import functools
 import logging
+import operator
+import re
+import sys
 from enum import Enum
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin
 
 import uuid
-from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass
+from psycopg2.extensions import register_adapter
+from psycopg2.extras import Json, register_uuid
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from simpleorm.db_util import DbUtil
 
+# Let the driver's C adapters do the conversions: dicts become jsonb
+# parameters and uuid.UUID round-trips, so format_value can pass values
+# through instead of re-serializing them in Python.
+register_adapter(dict, Json)
+register_uuid()
+
 logger = logging.getLogger("simpleorm.base_model")
 
 T = TypeVar("T", bound="BaseTableModel")
 
+# Matches every PascalCase word boundary (position before an uppercase letter,
+# except at the start), so "UserProfile" -> "user_profile" in one re.sub call.
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+def _get_col_meta(field_info: Any) -> Optional["ColumnMetadata"]:
+    """
+    Read the :class:`ColumnMetadata` stored by :func:`Column` off a Pydantic
+    ``FieldInfo``, or None for plainly-annotated fields. ``json_schema_extra``
+    always exists on FieldInfo and Column always stores a dict, so a single
+    ``.get()`` replaces the old hasattr/isinstance/in triple guard.
+    """
+    extra = field_info.json_schema_extra
+    metadata = extra.get("column_metadata") if isinstance(extra, dict) else None
+    if isinstance(metadata, dict):
+        # fields declared with a raw metadata dict instead of Column()
+        metadata = ColumnMetadata(**metadata)
+    return metadata
+
+
+_SQL_DEFAULT_FUNCTIONS = frozenset(
+    {"CURRENT_TIMESTAMP", "NOW()", "CURRENT_DATE", "CURRENT_TIME"}
+)
+
+_DB_TYPE_MAP = {
+    str: "TEXT",
+    int: "INTEGER",
+    float: "numeric",
+    datetime.datetime: "TIMESTAMP",
+    datetime.date: "DATE",
+    datetime.time: "TIME",
+    datetime.timedelta: "INTERVAL",
+    bool: "BOOLEAN",
+    dict: "JSONB",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_db_type(python_type: Any, is_timezone_aware: bool) -> str:
+    """
+    Resolve a Python annotation to a PostgreSQL type name. The answer depends
+    only on the annotation and the timezone flag, so it is memoized; typing
+    constructs (``Optional[...]``, ``List[...]``) hash, letting the cache be
+    shared across model classes.
+    """
+    if python_type is datetime.datetime:
+        return "TIMESTAMPTZ" if is_timezone_aware else "TIMESTAMP"
+
+    origin = get_origin(python_type)
+    if origin is Union:
+        args = get_args(python_type)
+        non_none_type = next((arg for arg in args if arg is not type(None)), None)
+        if non_none_type:
+            return _resolve_db_type(non_none_type, is_timezone_aware)
+
+    if origin is list:
+        args = get_args(python_type)
+        if len(args) != 1:
+            return "JSONB"
+        item_type = args[0]
+        sub_origin = get_origin(item_type) or item_type
+        if sub_origin is dict:
+            return "JSONB"
+        if sub_origin is datetime.datetime:
+            item_db_type = "TIMESTAMPTZ" if is_timezone_aware else "TIMESTAMP"
+        else:
+            item_db_type = _DB_TYPE_MAP.get(sub_origin, "TEXT")
+        return f"{item_db_type}[]" if item_db_type != "JSONB" else "JSONB"
+
+    if origin is dict:
+        return "JSONB"
+
+    return _DB_TYPE_MAP.get(python_type, "TEXT")
+
+
+def _make_values_getter(columns: tuple):
+    """
+    Build a per-class extractor returning attribute values for ``columns``
+    as a tuple in one C-level call (``operator.attrgetter``). Single-column
+    classes get a wrapper so the result is always a tuple.
+    """
+    if not columns:
+        return None
+    if len(columns) == 1:
+        getter = operator.attrgetter(columns[0])
+        return lambda instance: (getter(instance),)
+    return operator.attrgetter(*columns)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_update_sql(
+    table_name: str, set_columns: tuple, condition_columns: tuple
+) -> str:
+    """
+    Build (and cache) the UPDATE statement for a given table, SET-column
+    tuple, and WHERE-column tuple. Query shapes repeat heavily in practice,
+    so steady-state updates reuse one interned string per shape.
+    """
+    set_clause = ", ".join(f"{c} = %s" for c in set_columns)
+    condition_str = " AND ".join(f"{c} = %s" for c in condition_columns)
+    return sys.intern(f"UPDATE {table_name} SET {set_clause} WHERE {condition_str};")
+
+
+@functools.lru_cache(maxsize=512)
+def _build_select_sql(
+    table_name: str,
+    select_columns: tuple,
+    condition_str: str,
+    group_by_columns: Optional[tuple],
+    order_by_columns: Optional[tuple],
+    order_direction: str,
+    has_limit: bool,
+    has_offset: bool,
+    limit_one: bool = False,
+) -> str:
+    """
+    Build (and cache) a SELECT statement for a given shape. LIMIT/OFFSET are
+    emitted as ``%s`` placeholders so paging through a table reuses one
+    statement string per shape; identical shapes then hash to the same
+    interned string, which lets the server reuse its parse/plan work for
+    repeated queries.
+    """
+    parts = [f"SELECT {', '.join(select_columns)} FROM {table_name}"]
+    if condition_str:
+        parts.append(f" WHERE {condition_str}")
+    if group_by_columns:
+        parts.append(f" GROUP BY {', '.join(group_by_columns)}")
+    if order_by_columns:
+        parts.append(f" ORDER BY {', '.join(order_by_columns)} {order_direction}")
+    if limit_one:
+        parts.append(" LIMIT 1")
+    elif has_limit:
+        parts.append(" LIMIT %s")
+    if has_offset:
+        parts.append(" OFFSET %s")
+    parts.append(";")
+    return sys.intern("".join(parts))
+
+
+def _build_where(
+    and_condition_columns: Optional[List[str]],
+    and_condition_value: Optional[List[Any]],
+    or_condition_columns: Optional[List[str]],
+    or_condition_value: Optional[List[Any]],
+    custom_condition_query: Optional[str],
+    custom_query_inputs: Optional[List[Any]],
+):
+    """
+    Build the WHERE clause shared by the select helpers. Returns
+    ``(condition_str, condition_values)`` where ``condition_str`` is ""
+    when no condition was given. A custom condition query takes precedence
+    over the and/or column conditions, matching the public select API.
+    """
+    groups: List[str] = []
+    values: List[Any] = []
+
+    if custom_condition_query is not None:
+        groups.append(custom_condition_query)
+        values += custom_query_inputs or []
+    else:
+        if and_condition_columns is not None and and_condition_value is not None:
+            groups.append(
+                "(" + " AND ".join(f"{c} = %s" for c in and_condition_columns) + ")"
+            )
+            values += and_condition_value
+        if or_condition_columns is not None and or_condition_value is not None:
+            groups.append(
+                "(" + " OR ".join(f"{c} = %s" for c in or_condition_columns) + ")"
+            )
+            values += or_condition_value
+
+    return " AND ".join(groups), values
+
 
 class OnDeleteFkEnum(Enum):
     """Foreign key ON DELETE action for PostgreSQL."""
@@ -33,10 +218,15 @@ class OnDeleteFkEnum(Enum):
     NO_ACTION = "NO ACTION"
 
 
-class ColumnMetadata(BaseModel):
+@dataclass(frozen=True)
+class ColumnMetadata:
     """
     Metadata for a table column (stored in Pydantic Field metadata).
     Used by :func:`Column` and by :class:`BaseTableModel` for DDL and introspection.
+
+    A frozen dataclass rather than a Pydantic model: the values come from a
+    trusted :func:`Column` call, so there is nothing to validate, and the
+    helpers only ever read attributes from it.
     """
 
     db_default: Optional[Any] = None
@@ -79,7 +269,7 @@ def Column(
             email: str = Column(unique=True, index=True)
             created_at: datetime.datetime = Column(is_timezone_aware=True)
     """
-    metadata_dict = ColumnMetadata(
+    metadata = ColumnMetadata(
         db_default=db_default,
         index=index,
         index_name=index_name,
@@ -92,8 +282,8 @@ def Column(
         foreign_key_column=foreign_key_column,
         is_timezone_aware=is_timezone_aware,
         on_delete=on_delete,
-    ).model_dump(exclude_unset=True)
-    return Field(default=default, json_schema_extra={"column_metadata": metadata_dict})
+    )
+    return Field(default=default, json_schema_extra={"column_metadata": metadata})
 
 
 class BaseTableModel(BaseModel, extra="allow"):
@@ -106,129 +296,167 @@ class BaseTableModel(BaseModel, extra="allow"):
     select_many), and DML (delete); use instance methods for insert/update.
     """
 
-    model_config = ConfigDict(ser_json_timedelta="iso8601")
+    model_config = ConfigDict(ser_json_timedelta="iso8601", from_attributes=True)
     _is_backlogged_table: bool = False
+    _dirty_fields: set = PrivateAttr(default_factory=set)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Track assignments to declared columns so update() can write only changed ones."""
+        super().__setattr__(name, value)
+        if name in self.__class__.model_fields:
+            self._dirty_fields.add(name)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Precompute class-invariant SQL constants once per subclass: the
+        column tuple, primary-key tuple, and the all-columns INSERT template.
+        Runs after Pydantic has built ``model_fields``, so CRUD calls can use
+        these instead of re-walking field metadata.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._table_name = cls.classname_to_table_name(cls.__name__)
+        cls._sql_columns = tuple(cls.model_fields)
+
+        cls._sql_primary_keys = tuple(
+            name for name, _, metadata in cls._column_info()
+            if metadata is not None and metadata.primary_key
+        )
+        cls._sql_pk_values_getter = _make_values_getter(cls._sql_primary_keys)
+
+        cls._sql_delete_prefix = sys.intern(
+            f"DELETE FROM {cls.get_table_name()} WHERE "
+        )
+
+        placeholders = ", ".join(["%s"] * len(cls._sql_columns))
+        cls._sql_insert_all = sys.intern(
+            f"INSERT INTO {cls.get_table_name()} "
+            f"({', '.join(cls._sql_columns)}) VALUES ({placeholders})"
+        )
 
     @classmethod
     def is_backlogged_table(cls) -> bool:
         """Return whether this table is marked as backlogged (e.g. not in releases)."""
         return cls._is_backlogged_table
 
+    @classmethod
+    @contextlib.contextmanager
+    def _conn(cls, db_conn: Optional[DbUtil], do_commit: bool = False):
+        """
+        Yield ``db_conn`` if given, else a connection created from environment
+        parameters and closed (committing if ``do_commit``) on exit. Replaces
+        the per-method ``db_created_here`` flag boilerplate. Note that an
+        omitted ``db_conn`` still pays a full connection handshake per call —
+        pass a long-lived DbUtil to amortize it.
+        """
+        if db_conn is not None:
+            yield db_conn
+            return
+
+        db_conn = DbUtil()
+        db_conn.connect()
+        try:
+            yield db_conn
+        finally:
+            db_conn.disconnect(do_commit=do_commit)
+
     @staticmethod
     def format_value(value: Any) -> Any:
-        """Format a Python value for SQL (e.g. timedelta -> interval string, dict -> JSON)."""
-        if isinstance(value, str):
-            return f"{value}"
-        elif isinstance(value, list):
-            if len(value) > 0 and isinstance(value[0], dict):
-                return json.dumps(value)
-            return value
-        elif isinstance(value, datetime.timedelta):
-            days = value.days
-            seconds = value.seconds
-            hours, remainder = divmod(seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            return f"{days} days {hours:02}:{minutes:02}:{seconds:02}"
-        elif isinstance(value, dict):
-            return json.dumps(value)
-        elif isinstance(value, bool):
-            return value
-        elif value is None:
+        """
+        Prepare a Python value for parameterized execution. psycopg2 adapts
+        timedelta (INTERVAL), datetimes, numbers, lists (arrays), dicts
+        (via the Json adapter registered above) and UUIDs natively, so
+        values pass through untouched; only lists of dicts are wrapped in
+        Json and Enum members unwrapped.
+        """
+        if value is None:
             return None
-        return str(value)
+        # exact type checks: list/dict subclasses aren't expected here and
+        # type(x) is y skips the MRO walk isinstance pays per call
+        if type(value) is list and value and type(value[0]) is dict:
+            return Json(value)
+        if isinstance(value, Enum):
+            return value.value
+        return value
 
     @staticmethod
     def classname_to_table_name(classname: str) -> str:
         """Convert PascalCase class name to snake_case table name."""
-        table_name = classname[0].lower()
-        for char in classname[1:]:
-            if char.isupper():
-                table_name += "_"
-            table_name += char.lower()
-        return table_name
+        return _CAMEL_RE.sub("_", classname).lower()
 
     @staticmethod
     def get_db_type(
         python_type: Any, metadata: Optional[ColumnMetadata] = None
     ) -> str:
         """Map a Python type (including Optional, List, Dict) to a PostgreSQL type name."""
-        type_mapping = {
-            str: "TEXT",
-            int: "INTEGER",
-            float: "numeric",
-            datetime.datetime: (
-                "TIMESTAMPTZ"
-                if metadata and metadata.is_timezone_aware
-                else "TIMESTAMP"
-            ),
-            datetime.date: "DATE",
-            datetime.time: "TIME",
-            datetime.timedelta: "INTERVAL",
-            bool: "BOOLEAN",
-            dict: "JSONB",
-        }
-
-        origin = get_origin(python_type)
-        if origin is Union:
-            args = get_args(python_type)
-            non_none_type = next((arg for arg in args if arg is not type(None)), None)
-            if non_none_type:
-                return BaseTableModel.get_db_type(non_none_type, metadata)
-
-        if origin is list:
-            args = get_args(python_type)
-            if len(args) != 1:
-                return "JSONB"
-            item_type = args[0]
-            sub_origin = get_origin(item_type) or item_type
-            if sub_origin is dict:
-                return "JSONB"
-            item_db_type = type_mapping.get(sub_origin, "TEXT")
-            return f"{item_db_type}[]" if item_db_type != "JSONB" else "JSONB"
-
-        if origin is dict:
-            return "JSONB"
+        return _resolve_db_type(
+            python_type, bool(metadata and metadata.is_timezone_aware)
+        )
 
-        return type_mapping.get(python_type, "TEXT")
+    @classmethod
+    def _column_info(cls) -> tuple:
+        """
+        Return cached ``(name, python_type, metadata)`` triples for this
+        class's columns, where ``metadata`` is the parsed
+        :class:`ColumnMetadata` (or None for fields declared without
+        :func:`Column`). Computed once per class on first use; every
+        introspection/DDL/DML helper iterates this instead of re-reading
+        ``json_schema_extra`` and re-validating metadata per call.
+        """
+        cached = cls.__dict__.get("__column_info__")
+        if cached is not None:
+            return cached
+
+        info = []
+        # model_fields (not __annotations__) so inherited columns are seen
+        # and the per-name FieldInfo lookup is folded into the iteration.
+        for name, field_info in cls.model_fields.items():
+            metadata = _get_col_meta(field_info)
+            info.append((name, field_info.annotation, metadata))
+
+        cls.__column_info__ = tuple(info)
+        return cls.__column_info__
 
     @classmethod
     def get_table_name(cls) -> str:
         """Return the table name for this model (snake_case from class name)."""
-        return cls.classname_to_table_name(cls.__name__)
+        table_name = cls.__dict__.get("_table_name")
+        if table_name is None:
+            table_name = cls.classname_to_table_name(cls.__name__)
+            cls._table_name = table_name
+        return table_name
 
     @classmethod
-    def get_columns(cls) -> List[str]:
-        """Return the list of column names."""
-        return list(cls.__annotations__.keys())
+    def get_columns(cls) -> tuple:
+        """
+        Return the column names as a tuple (inherited columns included).
+        Precomputed per subclass; callers needing a mutable list must copy.
+        """
+        columns = cls.__dict__.get("_sql_columns")
+        if columns is None:
+            columns = tuple(cls.model_fields)
+        return columns
 
     @classmethod
     def get_primary_keys(cls) -> List[str]:
-        primary_keys = []
-        for name in cls.__annotations__:
-            field_info = cls.model_fields[name]
-            if (
-                hasattr(field_info, "json_schema_extra")
-                and isinstance(field_info.json_schema_extra, dict)
-                and "column_metadata" in field_info.json_schema_extra
-            ):
-                metadata = ColumnMetadata(**field_info.json_schema_extra["column_metadata"])
-                if metadata.primary_key:
-                    primary_keys.append(name)
-        return primary_keys
+        cached = cls.__dict__.get("_sql_primary_keys")
+        if cached is None:
+            cached = tuple(
+                name
+                for name, _, metadata in cls._column_info()
+                if metadata is not None and metadata.primary_key
+            )
+            cls._sql_primary_keys = cached
+        return list(cached)
 
     @classmethod
     def get_foreign_keys(cls) -> List[Dict[str, str]]:
         """Return list of dicts with keys: column, ref_table, ref_column."""
-        foreign_keys = []
-        for name in cls.__annotations__:
-            field_info = cls.model_fields[name]
-            if (
-                hasattr(field_info, "json_schema_extra")
-                and isinstance(field_info.json_schema_extra, dict)
-                and "column_metadata" in field_info.json_schema_extra
-            ):
-                metadata = ColumnMetadata(**field_info.json_schema_extra["column_metadata"])
-                if metadata.foreign_key_table is not None:
+        cached = cls.__dict__.get("__fk_cache__")
+        if cached is None:
+            foreign_keys = []
+            for name, _, metadata in cls._column_info():
+                if metadata is not None and metadata.foreign_key_table is not None:
                     foreign_keys.append(
                         {
                             "column": name,
@@ -236,21 +464,18 @@ class BaseTableModel(BaseModel, extra="allow"):
                             "ref_column": metadata.foreign_key_column or "",
                         }
                     )
-        return foreign_keys
+            cached = tuple(foreign_keys)
+            cls.__fk_cache__ = cached
+        return list(cached)
 
     @classmethod
     def get_indexes(cls) -> List[Dict[str, Any]]:
         """Return list of index definitions: name, column, type, table."""
         indexes = []
-        for name in cls.__annotations__:
-            field_info = cls.model_fields[name]
-            if (
-                hasattr(field_info, "json_schema_extra")
-                and isinstance(field_info.json_schema_extra, dict)
-                and "column_metadata" in field_info.json_schema_extra
-            ):
-                metadata = ColumnMetadata(**field_info.json_schema_extra["column_metadata"])
-                if metadata.index:
+        cached = cls.__dict__.get("__index_cache__")
+        if cached is None:
+            for name, _, metadata in cls._column_info():
+                if metadata is not None and metadata.index:
                     index_name = (
                         metadata.index_name or f"idx_{cls.get_table_name()}_{name}"
                     )
@@ -262,25 +487,19 @@ class BaseTableModel(BaseModel, extra="allow"):
                             "table": cls.get_table_name(),
                         }
                     )
-        return indexes
+            cached = tuple(indexes)
+            cls.__index_cache__ = cached
+        return list(cached)
 
     @classmethod
     def get_column_breakdown(cls) -> List[Dict[str, Any]]:
         """Return per-column metadata: name, type, nullable, default, ref_table, indexes, etc."""
         column_breakdown = []
-        for name in cls.__annotations__:
-            field_info = cls.model_fields[name]
-            metadata = None
-            if (
-                hasattr(field_info, "json_schema_extra")
-                and isinstance(field_info.json_schema_extra, dict)
-                and "column_metadata" in field_info.json_schema_extra
-            ):
-                metadata = ColumnMetadata(**field_info.json_schema_extra["column_metadata"])
+        for name, python_type, metadata in cls._column_info():
             column_breakdown.append(
                 {
                     "name": name,
-                    "type": cls.get_db_type(cls.__annotations__[name], metadata),
+                    "type": cls.get_db_type(python_type, metadata),
                     "nullable": metadata.nullable if metadata else False,
                     "default": metadata.db_default if metadata else None,
                     "ref_table": metadata.foreign_key_table if metadata else None,
@@ -306,23 +525,23 @@ class BaseTableModel(BaseModel, extra="allow"):
         """
         Generate CREATE TABLE (and CREATE INDEX) DDL for this model.
         If recreate is True, omit IF NOT EXISTS. Includes indexes from Column metadata.
+        The result is class-invariant, so it is cached per (class, recreate).
         """
+        cache = cls.__dict__.get("__ddl_cache__")
+        if cache is None:
+            cache = {}
+            cls.__ddl_cache__ = cache
+        cache_key = ("table", recreate)
+        if cache_key in cache:
+            return cache[cache_key]
+
         columns = []
         primary_keys = []
         foreign_keys = []
 
-        for name in cls.__annotations__:
+        for name, python_type, metadata in cls._column_info():
             constraints = []
-            field_info = cls.model_fields[name]
-            metadata = None
-            if (
-                hasattr(field_info, "json_schema_extra")
-                and isinstance(field_info.json_schema_extra, dict)
-                and "column_metadata" in field_info.json_schema_extra
-            ):
-                metadata = ColumnMetadata(**field_info.json_schema_extra["column_metadata"])
-
-            db_type = cls.get_db_type(cls.__annotations__[name], metadata)
+            db_type = cls.get_db_type(python_type, metadata)
 
             if metadata is not None:
                 if metadata.primary_key:
@@ -330,17 +549,11 @@ class BaseTableModel(BaseModel, extra="allow"):
                     constraints.append("NOT NULL")
                 if metadata.unique:
                     constraints.append("UNIQUE")
-                SQL_FUNCTIONS = {
-                    "CURRENT_TIMESTAMP",
-                    "NOW()",
-                    "CURRENT_DATE",
-                    "CURRENT_TIME",
-                }
                 if metadata.db_default is not None:
                     db_default = metadata.db_default
                     if (
                         isinstance(db_default, str)
-                        and db_default.upper() in SQL_FUNCTIONS
+                        and db_default.upper() in _SQL_DEFAULT_FUNCTIONS
                     ):
                         constraints.append(f"DEFAULT {db_default}")
                     elif isinstance(db_default, str):
@@ -359,19 +572,21 @@ class BaseTableModel(BaseModel, extra="allow"):
 
             columns.append(f"{name} {db_type} {' '.join(constraints)}")
 
-        primary_key_str = (
-            f", PRIMARY KEY ({', '.join(primary_keys)})" if primary_keys else ""
-        )
-        foreign_key_str = ", ".join(foreign_keys)
-        query = f"CREATE TABLE {'IF NOT EXISTS ' if not recreate else ''}{cls.classname_to_table_name(cls.__name__)} ("
-        query += ",".join(columns) + primary_key_str
+        parts = [
+            f"CREATE TABLE {'IF NOT EXISTS ' if not recreate else ''}{cls.get_table_name()} (",
+            ",".join(columns),
+        ]
+        if primary_keys:
+            parts.append(f", PRIMARY KEY ({', '.join(primary_keys)})")
         if foreign_keys:
-            query += f", {foreign_key_str}"
-        query += ");"
+            parts.append(f", {', '.join(foreign_keys)}")
+        parts.append(");")
 
         for index_ddl in cls.generate_index_ddl_queries():
-            query += f"\n{index_ddl}"
+            parts.append(f"\n{index_ddl}")
 
+        query = "".join(parts)
+        cache[cache_key] = query
         return query
 
     @classmethod
@@ -379,17 +594,16 @@ class BaseTableModel(BaseModel, extra="allow"):
         cls, include_if_not_exists: bool = True
     ) -> List[str]:
         """Generate CREATE INDEX statements for all columns with index=True."""
-        index_queries = []
-        for name in cls.__annotations__:
-            field_info = cls.model_fields[name]
-            metadata = None
-            if (
-                hasattr(field_info, "json_schema_extra")
-                and isinstance(field_info.json_schema_extra, dict)
-                and "column_metadata" in field_info.json_schema_extra
-            ):
-                metadata = ColumnMetadata(**field_info.json_schema_extra["column_metadata"])
+        cache = cls.__dict__.get("__ddl_cache__")
+        if cache is None:
+            cache = {}
+            cls.__ddl_cache__ = cache
+        cache_key = ("indexes", include_if_not_exists)
+        if cache_key in cache:
+            return list(cache[cache_key])
 
+        index_queries = []
+        for name, _, metadata in cls._column_info():
             if metadata is not None and metadata.index:
                 index_name = metadata.index_name or f"idx_{cls.get_table_name()}_{name}"
                 index_type = metadata.index_type or "btree"
@@ -399,6 +613,7 @@ class BaseTableModel(BaseModel, extra="allow"):
                 else:
                     index_sql = f"CREATE INDEX {if_not_exists}{index_name} ON {cls.get_table_name()} USING {index_type} ({name});"
                 index_queries.append(index_sql)
+        cache[cache_key] = tuple(index_queries)
         return index_queries
 
     @classmethod
@@ -406,19 +621,13 @@ class BaseTableModel(BaseModel, extra="allow"):
         """Return table names this model depends on via foreign keys (excluding self)."""
         dependencies = []
         table_name = cls.get_table_name()
-        for name in cls.__annotations__:
-            field_info = cls.model_fields[name]
+        for _, _, metadata in cls._column_info():
             if (
-                hasattr(field_info, "json_schema_extra")
-                and isinstance(field_info.json_schema_extra, dict)
-                and "column_metadata" in field_info.json_schema_extra
+                metadata is not None
+                and metadata.foreign_key_table is not None
+                and metadata.foreign_key_table != table_name
             ):
-                metadata = ColumnMetadata(**field_info.json_schema_extra["column_metadata"])
-                if (
-                    metadata.foreign_key_table is not None
-                    and metadata.foreign_key_table != table_name
-                ):
-                    dependencies.append(metadata.foreign_key_table)
+                dependencies.append(metadata.foreign_key_table)
         return dependencies
 
     @classmethod
@@ -434,73 +643,55 @@ class BaseTableModel(BaseModel, extra="allow"):
         or_condition_value: List[Any] = None,
         order_by_columns: List[str] = None,
         order_direction: str = "ASC",
+        validate: bool = True,
     ) -> Optional[T]:
         """
         Select at most one row; returns a model instance or None.
         Supports and_condition_*, or_condition_*, custom_condition_query, order_by.
+        With validate=False the row is materialized via :meth:`from_record`,
+        skipping Pydantic validation of driver-typed values.
         """
-        db_created_here = False
-        if db_conn is None:
-            db_conn = DbUtil()
-            db_conn.connect()
-            db_created_here = True
+        with cls._conn(db_conn) as db_conn:
+            try:
+                if select_columns is None:
+                    select_columns = ["*"]
+
+                condition_str, condition_value = _build_where(
+                    and_condition_columns,
+                    and_condition_value,
+                    or_condition_columns,
+                    or_condition_value,
+                    custom_condition_query,
+                    custom_query_inputs,
+                )
 
-        try:
-            if select_columns is None:
-                select_columns = ["*"]
-
-            condition_str_grps: List[str] = []
-            condition_value: List[Any] = []
-
-            if custom_condition_query is not None:
-                condition_str_grps.append(custom_condition_query)
-                condition_value += custom_query_inputs or []
-            else:
-                if (
-                    and_condition_columns is not None
-                    and and_condition_value is not None
-                ):
-                    condition_str_grps.append(
-                        "("
-                        + " AND ".join(
-                            [f"{c} = %s" for c in and_condition_columns]
-                        )
-                        + ")"
-                    )
-                    condition_value += and_condition_value
-                if or_condition_columns is not None and or_condition_value is not None:
-                    condition_str_grps.append(
-                        "("
-                        + " OR ".join(
-                            [f"{c} = %s" for c in or_condition_columns]
-                        )
-                        + ")"
-                    )
-                    condition_value += or_condition_value
-
-            query = f"SELECT {', '.join(select_columns)} FROM {cls.get_table_name()}"
-            if condition_str_grps:
-                query += " WHERE " + " AND ".join(condition_str_grps)
-            if order_by_columns is not None:
-                query += f" ORDER BY {', '.join(order_by_columns)} {order_direction}"
-            query += " LIMIT 1;"
-
-            result = db_conn.execute_query(
-                query=query,
-                data=tuple(condition_value) if condition_value else None,
-                get_column_names=True,
-            )
+                query = _build_select_sql(
+                    cls.get_table_name(),
+                    tuple(select_columns),
+                    condition_str,
+                    None,
+                    tuple(order_by_columns) if order_by_columns is not None else None,
+                    order_direction,
+                    False,
+                    False,
+                    limit_one=True,
+                )
 
-            if result and len(result) > 0:
-                return cls(**result[0])
-            return None
+                result = db_conn.execute_query(
+                    query=query,
+                    data=condition_value or None,
+                    get_column_names=True,
+                )
 
-        except Exception as e:
-            logger.error("Error in select_one: %s", e, exc_info=True)
-            raise
-        finally:
-            if db_created_here:
-                db_conn.disconnect()
+                if result and len(result) > 0:
+                    if not validate:
+                        return cls.from_record(result[0])
+                    return cls(**result[0])
+                return None
+
+            except Exception as e:
+                logger.error("Error in select_one: %s", e, exc_info=True)
+                raise
 
     @classmethod
     def select_many(
@@ -518,79 +709,184 @@ class BaseTableModel(BaseModel, extra="allow"):
         group_by_columns: List[str] = None,
         limit: int = None,
         offset: int = None,
+        validate: bool = True,
     ) -> List[T]:
         """
         Select multiple rows; returns a list of model instances.
         Supports and/or/custom conditions, group_by, order_by, limit, offset.
+        With validate=False rows are materialized via :meth:`from_record`,
+        skipping Pydantic validation — much faster on large trusted results.
+        """
+        with cls._conn(db_conn) as db_conn:
+            try:
+                if select_columns is None:
+                    select_columns = ["*"]
+
+                condition_str, condition_value = _build_where(
+                    and_condition_columns,
+                    and_condition_value,
+                    or_condition_columns,
+                    or_condition_value,
+                    custom_condition_query,
+                    custom_query_inputs,
+                )
+
+                query = _build_select_sql(
+                    cls.get_table_name(),
+                    tuple(select_columns),
+                    condition_str,
+                    tuple(group_by_columns) if group_by_columns is not None else None,
+                    tuple(order_by_columns) if order_by_columns is not None else None,
+                    order_direction,
+                    limit is not None,
+                    offset is not None,
+                )
+                if limit is not None:
+                    condition_value.append(limit)
+                if offset is not None:
+                    condition_value.append(offset)
+
+                result = db_conn.execute_query(
+                    query=query,
+                    data=condition_value or None,
+                    get_column_names=True,
+                )
+
+                if result and len(result) > 0:
+                    if not validate:
+                        # bind the C-path constructor once for the whole batch
+                        construct = cls.model_construct
+                        return [construct(**row) for row in result]
+                    return [cls(**row) for row in result]
+                return []
+
+            except Exception as e:
+                logger.error("Error in select_many: %s", e, exc_info=True)
+                raise
+
+    @classmethod
+    def from_record(cls: Type[T], record: Dict[str, Any]) -> T:
+        """
+        Materialize a model instance from a trusted DB row without running
+        Pydantic validation (``model_construct``). Intended for rows returned
+        by :meth:`select_records`; values coming from the database are
+        already typed by the driver.
+        """
+        return cls.model_construct(**dict(record))
+
+    @classmethod
+    def select_records(
+        cls,
+        db_conn: DbUtil = None,
+        select_columns: List[str] = None,
+        custom_condition_query: str = None,
+        custom_query_inputs: List[Any] = None,
+        order_by_columns: List[str] = None,
+        order_direction: str = "ASC",
+        limit: int = None,
+        offset: int = None,
+    ) -> List[Dict[str, Any]]:
         """
-        db_created_here = False
-        if db_conn is None:
-            db_conn = DbUtil()
-            db_conn.connect()
-            db_created_here = True
+        Select rows and return them as raw dict records, without building a
+        model instance per row. For bulk/analytic reads where only a few
+        columns are touched, skipping per-row model construction is much
+        cheaper; materialize individual rows later with :meth:`from_record`.
+        """
+        with cls._conn(db_conn) as db_conn:
+            try:
+                if select_columns is None:
+                    select_columns = ["*"]
+
+                parts = [f"SELECT {', '.join(select_columns)} FROM {cls.get_table_name()}"]
+                if custom_condition_query is not None:
+                    parts.append(f" WHERE {custom_condition_query}")
+                if order_by_columns is not None:
+                    parts.append(f" ORDER BY {', '.join(order_by_columns)} {order_direction}")
+                if limit is not None:
+                    parts.append(f" LIMIT {limit}")
+                if offset is not None:
+                    parts.append(f" OFFSET {offset}")
+                parts.append(";")
+                query = "".join(parts)
+
+                result = db_conn.execute_query(
+                    query=query,
+                    data=custom_query_inputs or None,
+                    get_column_names=True,
+                )
+
+                return result or []
+
+            except Exception as e:
+                logger.error("Error in select_records: %s", e, exc_info=True)
+                raise
 
+    @classmethod
+    def select_arrow(
+        cls,
+        db_conn: DbUtil = None,
+        select_columns: List[str] = None,
+        custom_condition_query: str = None,
+        custom_query_inputs: List[Any] = None,
+    ):
+        """
+        Select rows and return them as a columnar ``pyarrow.Table`` instead
+        of per-row model instances — for analytic consumers, Arrow columns
+        are contiguous and convert zero-copy to NumPy. Requires the optional
+        ``pyarrow`` dependency (``pip install simpleorm[arrow]``).
+        """
         try:
-            if select_columns is None:
-                select_columns = ["*"]
-
-            condition_str_grps: List[str] = []
-            condition_value: List[Any] = []
-
-            if custom_condition_query is not None:
-                condition_str_grps.append(custom_condition_query)
-                condition_value += custom_query_inputs or []
-            else:
-                if (
-                    and_condition_columns is not None
-                    and and_condition_value is not None
-                ):
-                    condition_str_grps.append(
-                        "("
-                        + " AND ".join(
-                            [f"{c} = %s" for c in and_condition_columns]
-                        )
-                        + ")"
-                    )
-                    condition_value += and_condition_value
-                if or_condition_columns is not None and or_condition_value is not None:
-                    condition_str_grps.append(
-                        "("
-                        + " OR ".join(
-                            [f"{c} = %s" for c in or_condition_columns]
-                        )
-                        + ")"
-                    )
-                    condition_value += or_condition_value
-
-            query = f"SELECT {', '.join(select_columns)} FROM {cls.get_table_name()}"
-            if condition_str_grps:
-                query += " WHERE " + " AND ".join(condition_str_grps)
-            if group_by_columns is not None:
-                query += f" GROUP BY {', '.join(group_by_columns)}"
-            if order_by_columns is not None:
-                query += f" ORDER BY {', '.join(order_by_columns)} {order_direction}"
-            if limit is not None:
-                query += f" LIMIT {limit}"
-            if offset is not None:
-                query += f" OFFSET {offset}"
-            query += ";"
-
-            result = db_conn.execute_query(
-                query=query,
-                data=tuple(condition_value) if condition_value else None,
-                get_column_names=True,
-            )
+            import pyarrow as pa
+        except ImportError as error:
+            raise RuntimeError(
+                "pyarrow is required for select_arrow; "
+                "install it with: pip install simpleorm[arrow]"
+            ) from error
+
+        rows = cls.select_records(
+            db_conn=db_conn,
+            select_columns=select_columns,
+            custom_condition_query=custom_condition_query,
+            custom_query_inputs=custom_query_inputs,
+        )
+        return pa.Table.from_pylist(rows)
+
+    @classmethod
+    def select_in(
+        cls: Type[T],
+        column: str,
+        values: List[Any],
+        db_conn: DbUtil = None,
+        select_columns: List[str] = None,
+    ) -> List[T]:
+        """
+        Select all rows where ``column`` matches any of ``values`` with a
+        single ``WHERE column = ANY(%s)`` query, instead of one select per
+        value (the classic N+1 pattern). Returns a list of model instances.
+        """
+        with cls._conn(db_conn) as db_conn:
+            try:
+                if select_columns is None:
+                    select_columns = ["*"]
+
+                query = (
+                    f"SELECT {', '.join(select_columns)} FROM {cls.get_table_name()}"
+                    f" WHERE {column} = ANY(%s);"
+                )
 
-            if result and len(result) > 0:
-                return [cls(**dict(row)) for row in result]
-            return []
+                result = db_conn.execute_query(
+                    query=query,
+                    data=(list(values),),
+                    get_column_names=True,
+                )
 
-        except Exception as e:
-            logger.error("Error in select_many: %s", e, exc_info=True)
-            raise
-        finally:
-            if db_created_here:
-                db_conn.disconnect()
+                if result and len(result) > 0:
+                    return [cls(**dict(row)) for row in result]
+                return []
+
+            except Exception as e:
+                logger.error("Error in select_in: %s", e, exc_info=True)
+                raise
 
     @classmethod
     def delete(
@@ -604,31 +900,120 @@ class BaseTableModel(BaseModel, extra="allow"):
         Delete rows matching condition_columns = condition_value.
         If no condition given, raises ValueError. Commits if self_commit is True.
         """
-        db_created_here = False
-        if db_conn is None:
-            db_conn = DbUtil()
-            db_conn.connect()
-            db_created_here = True
+        with cls._conn(db_conn, do_commit=self_commit) as db_conn:
+            try:
+                if condition_columns is None or condition_value is None:
+                    raise ValueError("Condition columns and values are required")
 
-        try:
-            if condition_columns is None or condition_value is None:
-                raise ValueError("Condition columns and values are required")
+                condition_str = " AND ".join([f"{c} = %s" for c in condition_columns])
+                prefix = cls.__dict__.get(
+                    "_sql_delete_prefix"
+                ) or f"DELETE FROM {cls.get_table_name()} WHERE "
+                query = f"{prefix}{condition_str};"
 
-            condition_str = " AND ".join([f"{c} = %s" for c in condition_columns])
-            query = f"DELETE FROM {cls.get_table_name()} WHERE {condition_str};"
+                db_conn.execute_query(
+                    query=query,
+                    data=tuple(condition_value),
+                    commit=self_commit,
+                    no_fetch=True,
+                )
+            except Exception as e:
+                logger.error("Error in delete: %s", e, exc_info=True)
+                raise
 
-            db_conn.execute_query(
-                query=query,
-                data=tuple(condition_value),
-                commit=self_commit,
-                no_fetch=True,
-            )
-        except Exception as e:
-            logger.error("Error in delete: %s", e, exc_info=True)
-            raise
-        finally:
-            if db_created_here:
-                db_conn.disconnect(do_commit=self_commit)
+    @classmethod
+    def bulk_insert(
+        cls,
+        rows: List["BaseTableModel"],
+        db_conn: DbUtil = None,
+        self_commit: bool = True,
+        chunk_size: int = 1000,
+    ) -> None:
+        """
+        Insert many rows with one multi-row INSERT per chunk of ``chunk_size``
+        instead of one round-trip per row. Columns are taken from the first
+        row's set fields; rows missing a column insert NULL for it.
+        """
+        with cls._conn(db_conn, do_commit=self_commit) as db_conn:
+            try:
+                if not rows:
+                    return
+
+                columns = [name for name, _ in rows[0]._iter_set_fields()]
+                if len(columns) == 1:
+                    single_column = columns[0]
+                    getter = lambda dumped: (dumped.get(single_column),)  # noqa: E731
+                else:
+                    # itemgetter extracts all values in one C call; fall back to
+                    # per-key .get() only for rows missing a column.
+                    item_getter = operator.itemgetter(*columns)
+
+                    def getter(dumped):
+                        try:
+                            return item_getter(dumped)
+                        except KeyError:
+                            return tuple(dumped.get(c) for c in columns)
+
+                row_values = []
+                for row in rows:
+                    dumped = dict(row._iter_set_fields())
+                    row_values.append([cls.format_value(value) for value in getter(dumped)])
+
+                row_placeholder = "(" + ", ".join(["%s"] * len(columns)) + ")"
+                for start in range(0, len(row_values), chunk_size):
+                    chunk = row_values[start : start + chunk_size]
+                    query = (
+                        f"INSERT INTO {cls.get_table_name()} ({', '.join(columns)}) VALUES "
+                        + ", ".join([row_placeholder] * len(chunk))
+                        + ";"
+                    )
+                    db_conn.execute_query(
+                        query=query,
+                        data=tuple(value for values in chunk for value in values),
+                        commit=self_commit,
+                        no_fetch=True,
+                    )
+            except Exception as e:
+                logger.error("Error in bulk_insert: %s", e, exc_info=True)
+                raise
+
+    @classmethod
+    def insert_many(
+        cls,
+        instances: List["BaseTableModel"],
+        db_conn: DbUtil = None,
+        self_commit: bool = True,
+        page_size: int = 1000,
+    ) -> None:
+        """
+        Insert many instances through ``psycopg2.extras.execute_values``,
+        which composes ``page_size`` rows per statement in C on the driver
+        side. The column list is computed once from the first instance's set
+        fields; instances missing a column insert NULL for it. Prefer this
+        over per-instance :meth:`insert` loops for bulk ingest.
+        """
+        with cls._conn(db_conn, do_commit=self_commit) as db_conn:
+            try:
+                if not instances:
+                    return
+
+                columns = [name for name, _ in instances[0]._iter_set_fields()]
+                row_values = []
+                for instance in instances:
+                    dumped = dict(instance._iter_set_fields())
+                    row_values.append(
+                        tuple(cls.format_value(dumped.get(c)) for c in columns)
+                    )
+
+                query = (
+                    f"INSERT INTO {cls.get_table_name()} ({', '.join(columns)}) VALUES %s"
+                )
+                db_conn.execute_values(
+                    query, row_values, page_size=page_size, commit=self_commit
+                )
+            except Exception as e:
+                logger.error("Error in insert_many: %s", e, exc_info=True)
+                raise
 
     def insert(
         self,
@@ -637,65 +1022,74 @@ class BaseTableModel(BaseModel, extra="allow"):
         update_on_conflict: bool = False,
         column_to_update_on_conflict: List[str] = None,
         do_not_execute: bool = False,
+        returning: List[str] = None,
     ) -> Dict[str, Any]:
         """
         Insert this instance. Returns {"query": str, "values": list}.
         update_on_conflict: use ON CONFLICT (pk) DO UPDATE for upsert.
         do_not_execute: only build and return query/values.
+        returning: column names to fetch back in the same round-trip via
+        RETURNING (e.g. server-side defaults); the rows are returned under
+        the "returned" key, saving the follow-up SELECT.
         """
-        db_created_here = False
-        if db_conn is None:
-            db_conn = DbUtil()
-            db_conn.connect()
-            db_created_here = True
+        with self._conn(db_conn, do_commit=self_commit) as db_conn:
+            try:
+                columns = []
+                values = []
 
-        try:
-            set_only_items = self.model_dump(exclude_unset=True, mode="json")
-            columns = []
-            values = []
-
-            for name, value in set_only_items.items():
-                columns.append(name)
-                values.append(self.__class__.format_value(value))
+                for name, value in self._iter_set_fields():
+                    columns.append(name)
+                    values.append(self.__class__.format_value(value))
 
-            placeholders = ", ".join(["%s" for _ in values])
-            query = f"INSERT INTO {self.__class__.get_table_name()} ({', '.join(columns)}) VALUES ({placeholders})"
+                if tuple(columns) == self.__class__.__dict__.get("_sql_columns"):
+                    query = self.__class__._sql_insert_all
+                else:
+                    placeholders = ", ".join(["%s" for _ in values])
+                    query = f"INSERT INTO {self.__class__.get_table_name()} ({', '.join(columns)}) VALUES ({placeholders})"
+
+                if update_on_conflict:
+                    primary_keys = self.__class__.get_primary_keys()
+                    columns_to_update = [
+                        c
+                        for c in columns
+                        if c not in primary_keys
+                        and (
+                            column_to_update_on_conflict is None
+                            or c in (column_to_update_on_conflict or [])
+                        )
+                    ]
+                    if columns_to_update:
+                        query = "".join(
+                            (
+                                query,
+                                " ON CONFLICT (",
+                                ", ".join(primary_keys),
+                                ") DO UPDATE SET ",
+                                ", ".join(f"{c} = EXCLUDED.{c}" for c in columns_to_update),
+                            )
+                        )
 
-            if update_on_conflict:
-                primary_keys = self.__class__.get_primary_keys()
-                columns_to_update = [
-                    c
-                    for c in columns
-                    if c not in primary_keys
-                    and (
-                        column_to_update_on_conflict is None
-                        or c in (column_to_update_on_conflict or [])
-                    )
-                ]
-                if columns_to_update:
-                    query += " ON CONFLICT (" + ", ".join(primary_keys) + ") DO UPDATE SET "
-                    query += ", ".join(
-                        f"{c} = EXCLUDED.{c}" for c in columns_to_update
+                if returning:
+                    query += f" RETURNING {', '.join(returning)}"
+                query += ";"
+
+                returned = None
+                if not do_not_execute:
+                    returned = db_conn.execute_query(
+                        query=query,
+                        data=tuple(values),
+                        commit=self_commit,
+                        no_fetch=not returning,
+                        get_column_names=bool(returning),
                     )
 
-            query += ";"
-
-            if not do_not_execute:
-                db_conn.execute_query(
-                    query=query,
-                    data=tuple(values),
-                    commit=self_commit,
-                    no_fetch=True,
-                )
-
-            return {"query": query, "values": values}
+                if returning:
+                    return {"query": query, "values": values, "returned": returned}
+                return {"query": query, "values": values}
 
-        except Exception as e:
-            logger.error("Error in insert: %s", e, exc_info=True)
-            raise
-        finally:
-            if db_created_here:
-                db_conn.disconnect(do_commit=self_commit)
+            except Exception as e:
+                logger.error("Error in insert: %s", e, exc_info=True)
+                raise
 
     def update(
         self,
@@ -707,74 +1101,123 @@ class BaseTableModel(BaseModel, extra="allow"):
         increment_value: List[Union[int, float]] = None,
         decrement_columns: List[str] = None,
         decrement_value: List[Union[int, float]] = None,
-    ) -> None:
+        condition_values_batch: List[tuple] = None,
+        returning: List[str] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
         """
         Update row(s). By default condition is primary key = current instance values.
         increment_columns / decrement_columns apply numeric +/- (CASE WHEN NULL THEN value ELSE col +/- value).
+        condition_values_batch: apply the same SET to many rows in one
+        statement via ``WHERE (cols) IN (VALUES ...)``; one tuple per row,
+        matching ``condition_columns`` (default: primary keys).
+        returning: column names to fetch back in the same round-trip via
+        RETURNING; returns the updated rows as dicts.
         """
-        db_created_here = False
-        if db_conn is None:
-            db_conn = DbUtil()
-            db_conn.connect()
-            db_created_here = True
+        with self._conn(db_conn, do_commit=self_commit) as db_conn:
+            try:
+                primary_keys = self.__class__.get_primary_keys()
 
-        try:
-            primary_keys = self.__class__.get_primary_keys()
-            set_only_items = self.model_dump(exclude_unset=True, mode="json")
+                columns = []
+                values = []
 
-            columns = []
-            values = []
+                # When assignments were tracked, only write the changed columns;
+                # otherwise fall back to every explicitly-set field.
+                dirty_fields = self._dirty_fields
 
-            for name, value in set_only_items.items():
-                if name not in primary_keys:
-                    columns.append(name)
-                    values.append(self.__class__.format_value(value))
+                for name, value in self._iter_set_fields():
+                    if name not in primary_keys and (
+                        not dirty_fields or name in dirty_fields
+                    ):
+                        columns.append(name)
+                        values.append(self.__class__.format_value(value))
 
-            a_query = [f"{c} = %s" for c in columns]
-            i_queries = []
-            d_queries = []
+                a_query = [f"{c} = %s" for c in columns]
+                i_queries = []
+                d_queries = []
 
-            if increment_columns is not None and increment_value is not None:
-                for column, value in zip(increment_columns, increment_value):
-                    i_queries.append(
-                        f"{column} = CASE WHEN {column} IS NULL THEN %s ELSE {column} + %s END"
-                    )
-                    values.append(value)
-                    values.append(value)
+                if increment_columns is not None and increment_value is not None:
+                    for column, value in zip(increment_columns, increment_value):
+                        i_queries.append(
+                            f"{column} = CASE WHEN {column} IS NULL THEN %s ELSE {column} + %s END"
+                        )
+                        values.append(value)
+                        values.append(value)
 
-            if decrement_columns is not None and decrement_value is not None:
-                for column, value in zip(decrement_columns, decrement_value):
-                    d_queries.append(
-                        f"{column} = CASE WHEN {column} IS NULL THEN 0 ELSE {column} - %s END"
+                if decrement_columns is not None and decrement_value is not None:
+                    for column, value in zip(decrement_columns, decrement_value):
+                        d_queries.append(
+                            f"{column} = CASE WHEN {column} IS NULL THEN 0 ELSE {column} - %s END"
+                        )
+                        values.append(value)
+
+                if condition_values_batch is not None:
+                    where_columns = condition_columns or primary_keys
+                    condition_value = [
+                        v for row in condition_values_batch for v in row
+                    ]
+                elif condition_columns is None or condition_value is None:
+                    where_columns = primary_keys
+                    pk_getter = self.__class__.__dict__.get("_sql_pk_values_getter")
+                    if pk_getter is not None:
+                        condition_value = list(pk_getter(self))
+                    else:
+                        condition_value = [getattr(self, c) for c in primary_keys]
+                else:
+                    where_columns = condition_columns
+
+                if condition_values_batch is not None:
+                    set_clause = ", ".join(a_query + i_queries + d_queries)
+                    row_placeholder = "(" + ", ".join(["%s"] * len(where_columns)) + ")"
+                    query = (
+                        f"UPDATE {self.__class__.get_table_name()} SET {set_clause}"
+                        f" WHERE ({', '.join(where_columns)}) IN (VALUES "
+                        + ", ".join([row_placeholder] * len(condition_values_batch))
+                        + ");"
                     )
-                    values.append(value)
+                elif not i_queries and not d_queries:
+                    query = _build_update_sql(
+                        self.__class__.get_table_name(),
+                        tuple(columns),
+                        tuple(where_columns),
+                    )
+                else:
+                    set_clause = ", ".join(a_query + i_queries + d_queries)
+                    condition_str = " AND ".join(f"{c} = %s" for c in where_columns)
+                    query = f"UPDATE {self.__class__.get_table_name()} SET {set_clause} WHERE {condition_str};"
 
-            set_clause = ", ".join(a_query + i_queries + d_queries)
+                if returning:
+                    if query.endswith(";"):
+                        query = query[:-1]
+                    query += f" RETURNING {', '.join(returning)};"
 
-            if condition_columns is None or condition_value is None:
-                condition_str = " AND ".join(
-                    f"{c} = %s" for c in primary_keys
-                )
-                condition_value = [getattr(self, c) for c in primary_keys]
-            else:
-                condition_str = " AND ".join(
-                    f"{c} = %s" for c in condition_columns
+                result = db_conn.execute_query(
+                    query=query,
+                    data=(*values, *condition_value),
+                    commit=self_commit,
+                    no_fetch=not returning,
+                    get_column_names=bool(returning),
                 )
 
-            query = f"UPDATE {self.__class__.get_table_name()} SET {set_clause} WHERE {condition_str};"
+                self._dirty_fields.clear()
+                return result if returning else None
+            except Exception as e:
+                logger.error("Error in update: %s", e, exc_info=True)
+                raise
 
-            db_conn.execute_query(
-                query=query,
-                data=tuple(values + list(condition_value)),
-                commit=self_commit,
-                no_fetch=True,
-            )
-        except Exception as e:
-            logger.error("Error in update: %s", e, exc_info=True)
-            raise
-        finally:
-            if db_created_here:
-                db_conn.disconnect(do_commit=self_commit)
+    def _iter_set_fields(self):
+        """
+        Yield ``(name, raw value)`` for explicitly-set fields in declaration
+        order, followed by any extra fields. Reads ``__pydantic_fields_set__``
+        directly so insert/update skip the full ``model_dump(mode="json")``
+        serializer walk; values go through :meth:`format_value` exactly once.
+        """
+        fields_set = self.__pydantic_fields_set__
+        for name in self.__class__.model_fields:
+            if name in fields_set:
+                yield name, getattr(self, name)
+        extra = self.__pydantic_extra__
+        if extra:
+            yield from extra.items()
 
     def gen_uid(self) -> str:
         """Return a new UUID string (e.g. for primary keys)."""
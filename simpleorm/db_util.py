@@ -6,16 +6,87 @@ parameterized SQL. Connection parameters can be passed explicitly or read
 from environment variables (e.g. ``DATABASE_HOST``, ``DATABASE_NAME``).
 """
 
+import functools
+import io
+import itertools
 import logging
 import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
 from typing import Dict, List, Type, Union, Any
 
 import psycopg2 as psycopg
+from psycopg2 import extras, sql
+from psycopg2.pool import ThreadedConnectionPool
 
 logger = logging.getLogger("simpleorm.db_util")
 
 ConnectionType: Type[psycopg.extensions.connection] = psycopg.extensions.connection
 
+_PLACEHOLDER_RE = re.compile(r"%s")
+
+
+@functools.lru_cache(maxsize=1024)
+def _to_dollar_params(query: str) -> str:
+    """
+    Rewrite ``%s`` placeholders to ``$1..$N`` for a server-side PREPARE.
+    Memoized: templates recur across connections (each reconnect re-PREPAREs
+    the same shapes), so the regex pass runs once per unique query text.
+    """
+    counter = itertools.count(1)
+    return _PLACEHOLDER_RE.sub(lambda _: f"${next(counter)}", query)
+
+
+# PostgreSQL type OIDs with a direct NumPy dtype, used to skip pandas'
+# row-scanning type inference when building DataFrames. Types without an
+# exact fixed-width match (text, numeric, timestamps) are left to pandas.
+# BOOL (OID 16) is deliberately absent: NumPy coerces None to False
+# silently instead of raising, so a NULL would come back as real data.
+# Integer columns with NULLs raise and fall back to inference; float
+# columns map NULL to NaN, which is pandas' own convention.
+_PG_OID_TO_DTYPE = {
+    20: "int64",  # INT8
+    21: "int16",  # INT2
+    23: "int32",  # INT4
+    700: "float32",  # FLOAT4
+    701: "float64",  # FLOAT8
+}
+
+
+# COPY text format needs backslash, tab and newline escaped in values.
+_COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+# Pools are shared process-wide, one per distinct parameter set, so every
+# DbUtil created for the same database reuses warm physical connections.
+_POOLS: Dict[tuple, ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(
+    params: Dict, min_size: int, max_size: int
+) -> ThreadedConnectionPool:
+    """Return (creating on first use) the shared pool for ``params``."""
+    key = tuple(sorted((k, str(v)) for k, v in params.items() if v is not None))
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None:
+                pool = ThreadedConnectionPool(min_size, max_size, **params)
+                _POOLS[key] = pool
+    return pool
+
+
+# Schemas already ensured by create_schema this process, keyed by
+# (host, database, schema) so connect() can skip the CREATE SCHEMA
+# round-trip on every connection after the first.
+_ENSURED_SCHEMAS: set = set()
+_ENSURED_SCHEMAS_LOCK = threading.Lock()
+
 
 class DbUtil:
     """
@@ -31,9 +102,32 @@ class DbUtil:
 
     connection: Type[psycopg.extensions.connection] = None
 
-    def __init__(self, params: Dict = None):
+    def __init__(
+        self,
+        params: Dict = None,
+        statement_cache_size: int = 0,
+        use_pool: bool = False,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+    ):
         """
         Build connection params from ``params`` and env (e.g. DATABASE_*).
+
+        ``statement_cache_size`` > 0 enables a per-connection server-side
+        prepared-statement cache: parameterized queries are PREPAREd on
+        first sight and re-invoked with EXECUTE, skipping PostgreSQL's
+        parse/plan on repeats. Off by default; repeated query shapes from
+        the model layer benefit most. Consider connecting with
+        ``session_settings={"plan_cache_mode": "force_custom_plan"}`` on
+        PG12+ to avoid the generic-plan cliff.
+
+        ``use_pool`` makes connect/disconnect check a warm physical
+        connection out of (and back into) a process-wide
+        ``ThreadedConnectionPool`` shared by all DbUtils with the same
+        parameters, instead of paying the TCP+auth handshake per DbUtil.
+        DbUtil is also a context manager: ``with DbUtil(use_pool=True) as
+        db: ...`` connects on entry and disconnects (committing on clean
+        exit) on exit.
         """
         params = params or {}
         self.connection_params = {
@@ -44,33 +138,138 @@ class DbUtil:
             "port": params.get("port") or os.getenv("DATABASE_PORT"),
         }
         self.connection = None
+        self.statement_cache_size = statement_cache_size
+        self.use_pool = use_pool
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self._stmt_cache: "OrderedDict[str, list]" = OrderedDict()
+        self._stmt_counter = 0
+        self._rowclass_cache: Dict[tuple, type] = {}
+        # reused across bulk_copy calls; stays grown to the high-water mark
+        # so repeated loads don't reallocate the serialization buffer
+        self._copy_buffer = io.StringIO()
+
+    def __enter__(self) -> "DbUtil":
+        if not self.connection:
+            self.connect()
+        return self
 
-    def connect(self, default_schema: str = None) -> None:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.disconnect(do_commit=exc_type is None)
+
+    def connect(self, default_schema: str = None, session_settings: Dict = None) -> None:
         """
         Open a connection. If ``default_schema`` is set, create the schema
         if needed and set the connection's search_path. Raises on failure.
+
+        ``session_settings`` maps setting names to values applied with
+        ``SET`` after connecting (e.g. ``{"effective_io_concurrency": 256}``
+        to let read-heavy selects exploit the server's async I/O). Settings
+        the server rejects (e.g. unknown on older PostgreSQL) are skipped
+        with a warning instead of failing the connection. Note that
+        server-scoped settings like ``io_method`` cannot be set per session.
         """
         try:
             if default_schema:
-                self.create_schema(default_schema)
+                schema_key = (
+                    self.connection_params.get("host"),
+                    self.connection_params.get("database"),
+                    default_schema,
+                )
+                if schema_key not in _ENSURED_SCHEMAS:
+                    self.create_schema(default_schema)
+                    with _ENSURED_SCHEMAS_LOCK:
+                        _ENSURED_SCHEMAS.add(schema_key)
+                    # create_schema connected before the search_path options
+                    # below existed, so a pooled connection came from (and
+                    # must go back to) the options-less pool; release it
+                    # before checking out the final connection
+                    self.disconnect()
                 self.connection_params["options"] = f"-c search_path={default_schema}"
 
-            self.connection = psycopg.connect(**self.connection_params)
+            if self.use_pool:
+                self.connection = _get_pool(
+                    self.connection_params, self.pool_min_size, self.pool_max_size
+                ).getconn()
+            else:
+                self.connection = psycopg.connect(**self.connection_params)
+            # prepared statements are per-connection server objects
+            self._stmt_cache.clear()
+
+            if session_settings:
+                self._apply_session_settings(session_settings)
         except Exception as error:
             logger.error("DB: Error creating connection", exc_info=True)
             raise RuntimeError("Failed to create DB Connection") from error
 
+    def _apply_session_settings(self, session_settings: Dict) -> None:
+        """Apply SET statements for ``session_settings``, skipping rejected ones."""
+        for name, value in session_settings.items():
+            try:
+                with self.connection.cursor() as cursor:
+                    cursor.execute(f"SET {name} = %s", (value,))
+            except Exception:
+                self.connection.rollback()
+                logger.warning(
+                    "DB: Session setting %s not applied; continuing", name
+                )
+
     def disconnect(self, do_commit: bool = False) -> None:
         """
-        Close the connection. If ``do_commit`` is True, commit before closing.
+        Close the connection (or return it to the pool when ``use_pool``).
+        If ``do_commit`` is True, commit before closing. Driver errors are
+        logged and swallowed so teardown never masks an in-flight
+        exception, but KeyboardInterrupt and friends propagate. The pooled
+        path always returns the connection — discarding it when the reset
+        fails — so a failed cleanup cannot leak a pool slot.
         """
+        if not self.connection:
+            return
         try:
-            if self.connection:
-                if do_commit:
-                    self.commit()
-                self.connection.close()
-        except BaseException:
-            pass
+            if do_commit:
+                self.commit()
+        except psycopg.Error:
+            logger.warning("DB: Error committing on disconnect", exc_info=True)
+        finally:
+            if self.use_pool:
+                self._release_to_pool()
+            else:
+                try:
+                    self.connection.close()
+                except psycopg.Error:
+                    logger.warning("DB: Error closing connection", exc_info=True)
+
+    def _release_to_pool(self) -> None:
+        """
+        Return the connection to the shared pool, deallocating its prepared
+        statements first so their names cannot leak into the next checkout.
+        If the reset fails, the connection is handed back with
+        ``close=True`` so the pool replaces it instead of losing the slot.
+        """
+        broken = False
+        try:
+            if self._stmt_cache:
+                # an aborted transaction would make DEALLOCATE fail too
+                self.connection.rollback()
+                with self.connection.cursor() as cursor:
+                    cursor.execute("DEALLOCATE ALL")
+                self._stmt_cache.clear()
+        except psycopg.Error:
+            broken = True
+            logger.warning("DB: Error resetting pooled connection", exc_info=True)
+        finally:
+            try:
+                _get_pool(
+                    self.connection_params,
+                    self.pool_min_size,
+                    self.pool_max_size,
+                ).putconn(self.connection, close=broken)
+            except psycopg.Error:
+                logger.warning(
+                    "DB: Error returning connection to pool", exc_info=True
+                )
+            finally:
+                self.connection = None
 
     def commit(self) -> None:
         """
@@ -93,7 +292,13 @@ class DbUtil:
                 self.connect()
 
             with self.connection.cursor() as cursor:
-                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+                # Identifier quoting keeps arbitrary schema names safe and
+                # the statement template constant across callers.
+                cursor.execute(
+                    sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(
+                        sql.Identifier(schema)
+                    )
+                )
 
             self.connection.commit()
         except Exception as error:
@@ -102,6 +307,249 @@ class DbUtil:
             logger.error("DB: Failed to create schema %s", schema, exc_info=True)
             raise RuntimeError(f"Failed to create Schema: {schema}") from error
 
+    def _execute_prepared(self, cursor, query: str, data: tuple) -> list:
+        """
+        Run ``query`` through the server-side prepared-statement cache:
+        PREPARE it under a generated name on first sight (evicting the
+        least-recently-used entry, with DEALLOCATE, when the cache is
+        full) and EXECUTE the named statement thereafter. Returns the
+        cache entry ``[stmt_name, column_names_or_None]`` so callers can
+        reuse the result-shape snapshot across executions.
+        """
+        entry = self._stmt_cache.get(query)
+        if entry is None:
+            self._stmt_counter += 1
+            name = f"s_{self._stmt_counter}"
+            cursor.execute(f"PREPARE {name} AS {_to_dollar_params(query)}")
+            entry = [name, None]
+            self._stmt_cache[query] = entry
+            if len(self._stmt_cache) > self.statement_cache_size:
+                _, evicted = self._stmt_cache.popitem(last=False)
+                cursor.execute(f"DEALLOCATE {evicted[0]}")
+        else:
+            self._stmt_cache.move_to_end(query)
+
+        if data:
+            placeholders = ", ".join(["%s"] * len(data))
+            cursor.execute(f"EXECUTE {entry[0]} ({placeholders})", data)
+        else:
+            # EXECUTE name () is a syntax error for zero-parameter statements
+            cursor.execute(f"EXECUTE {entry[0]}")
+        return entry
+
+    def execute_values(
+        self,
+        template: str,
+        rows: List[tuple],
+        page_size: int = 1000,
+        commit: bool = False,
+    ) -> None:
+        """
+        Execute a multi-row statement with ``psycopg2.extras.execute_values``:
+        one statement per ``page_size`` rows, VALUES lists composed in C.
+        ``template`` must contain a single ``%s`` marker for the row tuples
+        (e.g. ``"INSERT INTO t (a, b) VALUES %s"``). Raises on failure.
+        """
+        if not self.connection:
+            self.connect()
+
+        try:
+            with self.connection.cursor() as cursor:
+                extras.execute_values(cursor, template, rows, page_size=page_size)
+
+            if commit:
+                self.commit()
+        except Exception:
+            logger.error("DB: Error executing batched VALUES statement", exc_info=True)
+            raise
+
+    def insert_unnest(
+        self,
+        table: str,
+        columns: List[str],
+        rows_columnar: Dict[str, list],
+        column_types: Dict[str, str] = None,
+        commit: bool = False,
+    ) -> None:
+        """
+        Insert many rows with ``INSERT INTO t (a, b) SELECT * FROM
+        UNNEST(%s, %s)``: each column travels as one PostgreSQL array, so
+        the statement text is constant regardless of row count and the
+        server plans it once. ``rows_columnar`` maps column name to its
+        list of values; ``column_types`` optionally maps columns to SQL
+        type names used to cast the arrays (``%s::int4[]``) when the
+        server cannot infer them.
+        """
+        column_types = column_types or {}
+        placeholders = ", ".join(
+            f"%s::{column_types[column]}[]" if column in column_types else "%s"
+            for column in columns
+        )
+        query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"SELECT * FROM UNNEST({placeholders})"
+        )
+        self.execute_query(
+            query,
+            data=tuple(rows_columnar[column] for column in columns),
+            no_fetch=True,
+            commit=commit,
+        )
+
+    def bulk_copy(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[tuple],
+        commit: bool = False,
+    ) -> None:
+        """
+        Load ``rows`` (tuples matching ``columns``) into ``table`` with
+        ``COPY ... FROM STDIN``, which streams the data past the SQL
+        parser entirely — the fastest ingest path for large batches.
+        Values are written in COPY text format (tab-separated, ``\\N`` for
+        NULL); None maps to NULL and everything else is ``str()``-encoded,
+        so pre-format driver-adapted types (dicts, enums) before calling.
+        """
+        if not self.connection:
+            self.connect()
+
+        buffer = self._copy_buffer
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            buffer.write(
+                "\t".join(
+                    r"\N" if value is None else str(value).translate(_COPY_ESCAPES)
+                    for value in row
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.copy_from(
+                    buffer, table, sep="\t", null=r"\N", columns=columns
+                )
+
+            if commit:
+                self.commit()
+        except Exception:
+            logger.error("DB: Error bulk copying into %s", table, exc_info=True)
+            raise
+
+    def copy_from_dataframe(self, df, table: str, commit: bool = False) -> None:
+        """
+        COPY a pandas DataFrame into ``table`` (columns matched by name).
+        The frame is serialized once to an in-memory tab-separated buffer
+        via ``to_csv`` — pandas' C writer — then streamed with
+        ``COPY ... FROM STDIN`` like :meth:`bulk_copy`.
+        """
+        if not self.connection:
+            self.connect()
+
+        buffer = self._copy_buffer
+        buffer.seek(0)
+        buffer.truncate()
+        df.to_csv(buffer, sep="\t", header=False, index=False, na_rep=r"\N")
+        buffer.seek(0)
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.copy_from(
+                    buffer, table, sep="\t", null=r"\N", columns=list(df.columns)
+                )
+
+            if commit:
+                self.commit()
+        except Exception:
+            logger.error("DB: Error copying DataFrame into %s", table, exc_info=True)
+            raise
+
+    def execute_batch(
+        self,
+        query: str,
+        rows: List[tuple],
+        page_size: int = 1000,
+        commit: bool = False,
+    ) -> None:
+        """
+        Execute ``query`` once per tuple in ``rows`` with
+        ``psycopg2.extras.execute_batch``, sending ``page_size`` statements
+        per network round-trip — for batched UPDATE/DELETE templates where
+        VALUES-style consolidation does not apply. Raises on failure.
+        """
+        if not self.connection:
+            self.connect()
+
+        try:
+            with self.connection.cursor() as cursor:
+                extras.execute_batch(cursor, query, rows, page_size=page_size)
+
+            if commit:
+                self.commit()
+        except Exception:
+            logger.error("DB: Error executing statement batch", exc_info=True)
+            raise
+
+    def _stream_query(self, query: str, data: tuple = None, itersize: int = 1000):
+        """
+        Yield rows from a named (server-side) cursor. PostgreSQL holds the
+        result set and sends ``itersize`` rows per fetch, so resident memory
+        is bounded however large the result; the cursor closes when the
+        generator is exhausted or discarded.
+        """
+        self._stmt_counter += 1
+        cursor = self.connection.cursor(name=f"srv_{self._stmt_counter}")
+        cursor.itersize = itersize
+        try:
+            if data is not None:
+                cursor.execute(query, data)
+            else:
+                cursor.execute(query)
+            yield from cursor
+        except Exception:
+            logger.error("DB: Error streaming query", exc_info=True)
+            raise
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _fetch_dataframe(cursor, fetch_size: int = None):
+        """
+        Drain ``cursor`` into per-column lists and build a DataFrame
+        column-by-column: each column arrives as one 1-D array, avoiding
+        the row-tuple intermediate and pandas' 2D consolidation copy.
+        Columns whose PostgreSQL type OID maps to a fixed-width NumPy
+        dtype are converted directly, skipping pandas' per-value type
+        inference scan.
+        """
+        import numpy as np  # optional dependencies, imported on first use
+        import pandas as pd
+
+        description = cursor.description
+        column_names = [desc[0] for desc in description]
+        columns: List[list] = [[] for _ in column_names]
+        size = fetch_size or cursor.arraysize
+        while True:
+            chunk = cursor.fetchmany(size)
+            if not chunk:
+                break
+            for j, column in enumerate(columns):
+                column.extend(row[j] for row in chunk)
+
+        data = {}
+        for name, desc, column in zip(column_names, description, columns):
+            dtype = _PG_OID_TO_DTYPE.get(desc[1]) if len(desc) > 1 else None
+            if dtype is not None:
+                try:
+                    column = np.asarray(column, dtype=dtype)
+                except (TypeError, ValueError):
+                    pass  # NULLs present — fall back to pandas inference
+            data[name] = column
+        return pd.DataFrame(data, copy=False)
+
     def execute_query(
         self,
         query: str,
@@ -112,7 +560,11 @@ class DbUtil:
         no_fetch: bool = False,
         get_column_names: bool = False,
         hide_query_execution_log: bool = True,
-    ) -> Union[None, list, List[Dict[str, Any]]]:
+        as_pd: bool = False,
+        as_namedtuples: bool = False,
+        stream: bool = False,
+        fetch_size: int = 1000,
+    ) -> Union[None, list, List[Dict[str, Any]], Any]:
         """
         Execute a query with optional parameters and return format options.
 
@@ -124,23 +576,45 @@ class DbUtil:
             no_fetch: If True, do not fetch results (e.g. INSERT/UPDATE); returns None.
             get_column_names: If True, return list of dicts (column name -> value).
             hide_query_execution_log: If False, log the executed query.
+            as_pd: If True, return a ``pandas.DataFrame`` built column-by-column
+                (requires the optional pandas dependency).
+            as_namedtuples: If True, return rows as namedtuples (one class per
+                result shape, cached) — attribute access at about half a
+                dict's memory per row.
+            stream: If True, return a generator backed by a named
+                (server-side) cursor fetching ``fetch_size`` rows at a time;
+                peak memory stays O(fetch_size) regardless of result size.
+                Requires an open transaction (autocommit off) and ignores
+                the other return-format options.
+            fetch_size: Rows fetched per ``fetchmany`` round while draining the
+                cursor; bounds peak driver-side buffering on large results.
 
         Returns:
-            Rows as list of tuples, or list of dicts if get_column_names=True; None if no_fetch.
+            Rows as list of tuples, list of dicts if get_column_names=True,
+            or a DataFrame if as_pd=True; None if no_fetch.
         Raises:
             Exception: On execution or commit failure.
         """
         if not self.connection:
             self.connect(table_schema)
 
+        if stream:
+            return self._stream_query(query, data, itersize=fetch_size)
+
         try:
             with self.connection.cursor() as cursor:
+                stmt_entry = None
                 if data is not None:
-                    cursor.execute(query, data)
+                    if self.statement_cache_size:
+                        stmt_entry = self._execute_prepared(cursor, query, data)
+                    else:
+                        cursor.execute(query, data)
                 else:
                     cursor.execute(query)
 
-                if not hide_query_execution_log:
+                if not hide_query_execution_log and logger.isEnabledFor(
+                    logging.INFO
+                ):
                     logger.info("Query executed: %s", cursor.query.decode("utf-8"))
 
                 if commit:
@@ -149,11 +623,40 @@ class DbUtil:
                 if no_fetch:
                     return None
 
-                result = cursor.fetchall()
+                cursor.arraysize = fetch_size
+
+                if as_pd:
+                    return self._fetch_dataframe(cursor)
+
+                result: list = []
+                while True:
+                    chunk = cursor.fetchmany(fetch_size)
+                    if not chunk:
+                        break
+                    result.extend(chunk)
+
+                if as_namedtuples or get_column_names:
+                    # column names are invariant per prepared statement, so
+                    # reuse the snapshot on the cache entry across executions
+                    if stmt_entry is not None and stmt_entry[1] is not None:
+                        names = stmt_entry[1]
+                    else:
+                        names = tuple(desc[0] for desc in cursor.description)
+                        if stmt_entry is not None:
+                            stmt_entry[1] = names
+
+                if as_namedtuples:
+                    row_cls = self._rowclass_cache.get(names)
+                    if row_cls is None:
+                        row_cls = namedtuple("Row", names, rename=True)
+                        self._rowclass_cache[names] = row_cls
+                    return list(map(row_cls._make, result))
 
                 if get_column_names:
-                    column_names = [desc[0] for desc in cursor.description]
-                    return [dict(zip(column_names, row)) for row in result]
+                    # Indexed comprehension over a constant tuple avoids a
+                    # zip-object allocation per row on wide results.
+                    width = range(len(names))
+                    return [{names[i]: row[i] for i in width} for row in result]
 
                 return result
 
@@ -0,0 +1,179 @@
+"""
+Synchronous psycopg (v3) connection utilities with pipeline-mode support.
+
+This module provides :class:`PsycopgDbUtil`, a psycopg 3 counterpart to
+:class:`simpleorm.db_util.DbUtil` for users who want batched round-trips
+without adopting asyncio: statements issued inside ``with db.pipeline():``
+are flushed to the server as one network batch, and ``prepare_threshold``
+promotes repeated query templates to server-side prepared statements.
+
+psycopg 3 is an optional dependency; install it with ``pip install
+simpleorm[psycopg3]``.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Union
+
+try:
+    import psycopg as psycopg3
+except ImportError:  # optional dependency
+    psycopg3 = None
+
+logger = logging.getLogger("simpleorm.db_util_psycopg")
+
+
+class PsycopgDbUtil:
+    """
+    PostgreSQL connection manager and query executor backed by psycopg 3.
+
+    Mirrors :class:`simpleorm.db_util.DbUtil`: parameters not provided in
+    ``params`` fall back to environment variables (``DATABASE_HOST``,
+    ``DATABASE_NAME``, ``DATABASE_USER``, ``DATABASE_PASS``,
+    ``DATABASE_PORT``), and queries use ``%s`` placeholders.
+
+    On success, methods return the result (or None); on failure they log
+    and raise (e.g. :exc:`RuntimeError`).
+    """
+
+    def __init__(self, params: Dict = None):
+        """
+        Build connection params from ``params`` and env (e.g. DATABASE_*).
+        Raises :exc:`RuntimeError` if psycopg 3 is not installed.
+        """
+        if psycopg3 is None:
+            raise RuntimeError(
+                "psycopg (v3) is required for PsycopgDbUtil; "
+                "install it with: pip install simpleorm[psycopg3]"
+            )
+        params = params or {}
+        self.connection_params = {
+            "host": params.get("host") or os.getenv("DATABASE_HOST"),
+            "dbname": params.get("database") or os.getenv("DATABASE_NAME"),
+            "user": params.get("user") or os.getenv("DATABASE_USER"),
+            "password": params.get("password") or os.getenv("DATABASE_PASS"),
+            "port": params.get("port") or os.getenv("DATABASE_PORT"),
+        }
+        self.connection = None
+
+    def connect(self, prepare_threshold: int = 1, prepared_max: int = 200) -> None:
+        """
+        Open a psycopg 3 connection. ``prepare_threshold`` controls after how
+        many executions a query template is promoted to a server-side
+        prepared statement (1 prepares on first execution, so model query
+        templates are prepared immediately); ``prepared_max`` bounds how many
+        statements stay prepared per connection. Raises on failure.
+        """
+        try:
+            self.connection = psycopg3.connect(
+                prepare_threshold=prepare_threshold,
+                **self.connection_params,
+            )
+            self.connection.prepared_max = prepared_max
+        except Exception as error:
+            logger.error("DB: Error creating connection", exc_info=True)
+            raise RuntimeError("Failed to create DB Connection") from error
+
+    def disconnect(self, do_commit: bool = False) -> None:
+        """
+        Close the connection. If ``do_commit`` is True, commit before
+        closing. Driver errors are logged and swallowed so teardown never
+        masks an in-flight exception, but KeyboardInterrupt and friends
+        propagate.
+        """
+        if not self.connection:
+            return
+        try:
+            if do_commit:
+                self.connection.commit()
+        except psycopg3.Error:
+            logger.warning("DB: Error committing on disconnect", exc_info=True)
+        finally:
+            try:
+                self.connection.close()
+            except psycopg3.Error:
+                logger.warning("DB: Error closing connection", exc_info=True)
+
+    def commit(self) -> None:
+        """
+        Commit the current transaction. Raises if there is no connection or commit fails.
+        """
+        if not self.connection:
+            raise RuntimeError("No connection found to commit")
+        self.connection.commit()
+
+    def pipeline(self):
+        """
+        Return psycopg's pipeline context manager. Statements executed inside
+        the ``with`` block are sent to the server as one batched flush,
+        amortizing network round-trips across e.g. a loop of inserts.
+        """
+        if not self.connection:
+            self.connect()
+        return self.connection.pipeline()
+
+    def execute_many(
+        self,
+        query: str,
+        rows: List[tuple],
+        commit: bool = False,
+    ) -> None:
+        """
+        Execute ``query`` once per row in ``rows`` inside a single pipeline
+        flush, so N statements cost one network round-trip instead of N.
+        Repeated templates also hit the connection's prepared-statement
+        cache (see :meth:`connect`).
+        """
+        if not self.connection:
+            self.connect()
+
+        try:
+            with self.connection.pipeline():
+                with self.connection.cursor() as cursor:
+                    cursor.executemany(query, rows)
+
+            if commit:
+                self.commit()
+        except Exception:
+            logger.error("DB: Error executing batched query", exc_info=True)
+            raise
+
+    def execute_query(
+        self,
+        query: str,
+        data: tuple = None,
+        commit: bool = False,
+        no_fetch: bool = False,
+        get_column_names: bool = False,
+    ) -> Union[None, list, List[Dict[str, Any]]]:
+        """
+        Execute a query with optional parameters; same return-format options
+        as :meth:`DbUtil.execute_query`.
+        """
+        if not self.connection:
+            self.connect()
+
+        try:
+            with self.connection.cursor() as cursor:
+                if data is not None:
+                    cursor.execute(query, data)
+                else:
+                    cursor.execute(query)
+
+                if commit:
+                    self.commit()
+
+                if no_fetch:
+                    return None
+
+                result = cursor.fetchall()
+
+                if get_column_names:
+                    column_names = [desc[0] for desc in cursor.description]
+                    return [dict(zip(column_names, row)) for row in result]
+
+                return result
+
+        except Exception:
+            logger.error("DB: Error executing query", exc_info=True)
+            raise
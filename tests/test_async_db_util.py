@@ -0,0 +1,148 @@
+"""Tests for simpleorm.async_db_util."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from simpleorm.async_db_util import AsyncDbUtil
+
+DEFAULT_PARAMS = {"host": "localhost", "database": "test"}
+
+
+def make_async_conn(fetch_result=None):
+    """Return a mocked asyncpg connection with awaitable methods."""
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value="INSERT 0 1")
+    conn.executemany = AsyncMock()
+    conn.fetch = AsyncMock(return_value=fetch_result or [])
+    conn.set_type_codec = AsyncMock()
+    conn.close = AsyncMock()
+    return conn
+
+
+def make_asyncpg(conn=None, pool=None):
+    """Return a mocked asyncpg module wired to ``conn``/``pool``."""
+    mock_asyncpg = MagicMock()
+    mock_asyncpg.connect = AsyncMock(return_value=conn)
+    mock_asyncpg.create_pool = AsyncMock(return_value=pool)
+    # real exception classes so except clauses in the module still work
+    mock_asyncpg.PostgresError = type("PostgresError", (Exception,), {})
+    mock_asyncpg.InterfaceError = type("InterfaceError", (Exception,), {})
+    return mock_asyncpg
+
+
+class TestAsyncDbUtil:
+    """Tests for AsyncDbUtil class."""
+
+    def test_init_without_asyncpg(self):
+        """Test initialization raises when asyncpg is not installed."""
+        with patch("simpleorm.async_db_util.asyncpg", None):
+            with pytest.raises(RuntimeError, match="asyncpg is required"):
+                AsyncDbUtil(params=DEFAULT_PARAMS)
+
+    def test_connect(self):
+        """Test connect opens a connection and registers the json codecs."""
+        conn = make_async_conn()
+        mock_asyncpg = make_asyncpg(conn=conn)
+        with patch("simpleorm.async_db_util.asyncpg", mock_asyncpg):
+            db = AsyncDbUtil(params=DEFAULT_PARAMS)
+            asyncio.run(db.connect())
+
+        assert db.connection is conn
+        connect_kwargs = mock_asyncpg.connect.await_args.kwargs
+        assert connect_kwargs["host"] == "localhost"
+        assert connect_kwargs["database"] == "test"
+        assert connect_kwargs["statement_cache_size"] == 1000
+        # json and jsonb codecs are registered on the new connection
+        assert conn.set_type_codec.await_count == 2
+
+    def test_fetch_with_placeholders(self):
+        """Test fetch passes $n args through and maps records to dicts."""
+        conn = make_async_conn(fetch_result=[{"id": 1, "name": "test"}])
+        with patch("simpleorm.async_db_util.asyncpg", make_asyncpg(conn=conn)):
+            db = AsyncDbUtil(params=DEFAULT_PARAMS)
+            result = asyncio.run(
+                db.fetch("SELECT * FROM test WHERE id = $1", 1)
+            )
+            as_dicts = asyncio.run(
+                db.fetch(
+                    "SELECT * FROM test WHERE id = $1", 1, get_column_names=True
+                )
+            )
+
+        conn.fetch.assert_awaited_with("SELECT * FROM test WHERE id = $1", 1)
+        assert result == [{"id": 1, "name": "test"}]
+        assert as_dicts == [{"id": 1, "name": "test"}]
+
+    def test_pool_acquire_release(self):
+        """Test pooled execute borrows a connection and releases it."""
+        conn = make_async_conn()
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.return_value = conn
+        pool.close = AsyncMock()
+        with patch("simpleorm.async_db_util.asyncpg", make_asyncpg(pool=pool)):
+            db = AsyncDbUtil(params=DEFAULT_PARAMS)
+            asyncio.run(db.connect_pool(min_size=2, max_size=4))
+            asyncio.run(db.execute("INSERT INTO test VALUES ($1)", 1))
+
+        assert db.pool is pool
+        pool.acquire.assert_called_once()
+        conn.execute.assert_awaited_once_with("INSERT INTO test VALUES ($1)", 1)
+        # the connection goes back to the pool after the statement
+        pool.acquire.return_value.__aexit__.assert_awaited_once()
+
+    def test_disconnect_closes_pool_when_connection_close_fails(self):
+        """Test a failing connection close still closes the pool."""
+        conn = make_async_conn()
+        pool = MagicMock()
+        pool.close = AsyncMock()
+        mock_asyncpg = make_asyncpg(conn=conn, pool=pool)
+        conn.close.side_effect = mock_asyncpg.InterfaceError("already dead")
+        with patch("simpleorm.async_db_util.asyncpg", mock_asyncpg):
+            db = AsyncDbUtil(params=DEFAULT_PARAMS)
+            db.connection = conn
+            db.pool = pool
+            asyncio.run(db.disconnect())
+
+        pool.close.assert_awaited_once()
+        assert db.connection is None
+        assert db.pool is None
+
+    def test_executemany(self):
+        """Test executemany streams every binding set through one statement."""
+        conn = make_async_conn()
+        with patch("simpleorm.async_db_util.asyncpg", make_asyncpg(conn=conn)):
+            db = AsyncDbUtil(params=DEFAULT_PARAMS)
+            asyncio.run(
+                db.executemany(
+                    "INSERT INTO test VALUES ($1, $2)", [(1, "a"), (2, "b")]
+                )
+            )
+
+        conn.executemany.assert_awaited_once_with(
+            "INSERT INTO test VALUES ($1, $2)", [(1, "a"), (2, "b")]
+        )
+
+    def test_execute_pipelined_sequential_in_transaction(self):
+        """Test a multi-statement batch runs sequentially in one transaction."""
+        conn = make_async_conn()
+        with patch("simpleorm.async_db_util.asyncpg", make_asyncpg(conn=conn)):
+            db = AsyncDbUtil(params=DEFAULT_PARAMS)
+            result = asyncio.run(
+                db.execute_pipelined(
+                    [
+                        ("INSERT INTO test VALUES ($1)", (1,)),
+                        ("INSERT INTO test VALUES ($1)", (2,)),
+                    ]
+                )
+            )
+
+        assert result == ["INSERT 0 1", "INSERT 0 1"]
+        # both statements go through one transaction, awaited one at a time
+        conn.transaction.assert_called_once()
+        conn.transaction.return_value.__aenter__.assert_awaited_once()
+        assert conn.execute.await_args_list == [
+            call("INSERT INTO test VALUES ($1)", 1),
+            call("INSERT INTO test VALUES ($1)", 2),
+        ]
@@ -66,7 +66,8 @@ class TestColumn:
     def test_column_with_metadata(self):
         """Test column with metadata."""
         field = Column(primary_key=True, unique=True, index=True)
-        metadata = ColumnMetadata(**field.json_schema_extra["column_metadata"])
+        metadata = field.json_schema_extra["column_metadata"]
+        assert isinstance(metadata, ColumnMetadata)
         assert metadata.primary_key is True
         assert metadata.unique is True
         assert metadata.index is True
@@ -79,7 +80,7 @@ class TestColumn:
             foreign_key_column="user_id",
             on_delete=OnDeleteFkEnum.CASCADE,
         )
-        metadata = ColumnMetadata(**field.json_schema_extra["column_metadata"])
+        metadata = field.json_schema_extra["column_metadata"]
         assert metadata.foreign_key_table == "user"
         assert metadata.foreign_key_column == "user_id"
         assert metadata.on_delete == OnDeleteFkEnum.CASCADE
@@ -129,34 +130,32 @@ class TestBaseTableModel:
         assert BaseTableModel.get_db_type(List[dict]) == "JSONB"
 
     def test_format_value(self):
-        """Test value formatting for SQL."""
+        """Test scalars pass through for driver adaptation."""
         assert BaseTableModel.format_value("test") == "test"
-        assert BaseTableModel.format_value(123) == "123"
+        assert BaseTableModel.format_value(123) == 123
         assert BaseTableModel.format_value(True) is True
         assert BaseTableModel.format_value(None) is None
 
     def test_format_value_dict(self):
-        """Test dict formatting to JSON."""
-        import json
-
+        """Test dicts pass through (adapted to jsonb by the registered Json adapter)."""
         value = {"key": "value"}
-        result = BaseTableModel.format_value(value)
-        assert result == json.dumps(value)
+        assert BaseTableModel.format_value(value) is value
 
     def test_format_value_list_of_dicts(self):
-        """Test list of dicts formatting to JSON."""
+        """Test list of dicts is wrapped in Json for jsonb adaptation."""
         import json
 
+        from psycopg2.extras import Json
+
         value = [{"a": 1}, {"b": 2}]
         result = BaseTableModel.format_value(value)
-        assert result == json.dumps(value)
+        assert isinstance(result, Json)
+        assert result.dumps(result.adapted) == json.dumps(value)
 
     def test_format_value_timedelta(self):
-        """Test timedelta formatting."""
+        """Test timedelta passes through (psycopg2 adapts it to INTERVAL)."""
         delta = datetime.timedelta(days=1, hours=2, minutes=3, seconds=4)
-        result = BaseTableModel.format_value(delta)
-        assert "1 days" in result
-        assert "02:03:04" in result
+        assert BaseTableModel.format_value(delta) is delta
 
 
 class TestModelDefinition:
@@ -311,6 +310,22 @@ class TestModelDQL:
         assert results[0].user_id == "1"
         assert results[1].user_id == "2"
 
+    @patch("simpleorm.base_model.DbUtil")
+    def test_select_many_without_validation(self, mock_db_util_class):
+        """Test select_many with validate=False builds instances via model_construct."""
+        mock_db = MagicMock()
+        mock_db.execute_query.return_value = [
+            {"user_id": "1", "name": "Test1", "email": "test1@example.com"},
+        ]
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        results = self.User.select_many(db_conn=mock_db, validate=False)
+
+        assert len(results) == 1
+        assert results[0].user_id == "1"
+        assert results[0].name == "Test1"
+
     @patch("simpleorm.base_model.DbUtil")
     def test_select_many_empty(self, mock_db_util_class):
         """Test select_many returns empty list when no results."""
@@ -323,6 +338,42 @@ class TestModelDQL:
 
         assert results == []
 
+    @patch("simpleorm.base_model.DbUtil")
+    def test_select_records(self, mock_db_util_class):
+        """Test select_records returns raw dict rows without model construction."""
+        mock_db = MagicMock()
+        mock_db.execute_query.return_value = [
+            {"user_id": "1", "name": "Test", "email": "test@example.com"},
+        ]
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        records = self.User.select_records(db_conn=mock_db)
+
+        assert records == [{"user_id": "1", "name": "Test", "email": "test@example.com"}]
+        user = self.User.from_record(records[0])
+        assert isinstance(user, self.User)
+        assert user.user_id == "1"
+
+    @patch("simpleorm.base_model.DbUtil")
+    def test_select_in(self, mock_db_util_class):
+        """Test select_in issues a single ANY(%s) query."""
+        mock_db = MagicMock()
+        mock_db.execute_query.return_value = [
+            {"user_id": "1", "name": "Test1", "email": "test1@example.com"},
+            {"user_id": "2", "name": "Test2", "email": "test2@example.com"},
+        ]
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        results = self.User.select_in("user_id", ["1", "2"], db_conn=mock_db)
+
+        assert len(results) == 2
+        query_call = mock_db.execute_query.call_args[1]["query"]
+        data_call = mock_db.execute_query.call_args[1]["data"]
+        assert "user_id = ANY(%s)" in query_call
+        assert data_call == (["1", "2"],)
+
     @patch("simpleorm.base_model.DbUtil")
     def test_select_one_with_order_by(self, mock_db_util_class):
         """Test select_one with order_by."""
@@ -395,6 +446,61 @@ class TestModelDML:
         mock_db.execute_query.assert_not_called()
         assert "query" in result
 
+    @patch("simpleorm.base_model.DbUtil")
+    def test_bulk_insert(self, mock_db_util_class):
+        """Test bulk_insert issues a single multi-row INSERT."""
+        mock_db = MagicMock()
+        mock_db.execute_query = MagicMock()
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        users = [
+            self.User(user_id="1", name="Test1", email="test1@example.com"),
+            self.User(user_id="2", name="Test2", email="test2@example.com"),
+        ]
+        self.User.bulk_insert(users, db_conn=mock_db)
+
+        mock_db.execute_query.assert_called_once()
+        query_call = mock_db.execute_query.call_args[1]["query"]
+        data_call = mock_db.execute_query.call_args[1]["data"]
+        assert "INSERT INTO" in query_call
+        assert query_call.count("(%s, %s, %s)") == 2
+        assert data_call == ("1", "Test1", "test1@example.com", "2", "Test2", "test2@example.com")
+
+    @patch("simpleorm.base_model.DbUtil")
+    def test_bulk_insert_empty(self, mock_db_util_class):
+        """Test bulk_insert with no rows does nothing."""
+        mock_db = MagicMock()
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        self.User.bulk_insert([], db_conn=mock_db)
+
+        mock_db.execute_query.assert_not_called()
+
+    @patch("simpleorm.base_model.DbUtil")
+    def test_insert_many(self, mock_db_util_class):
+        """Test insert_many batches rows through DbUtil.execute_values."""
+        mock_db = MagicMock()
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        users = [
+            self.User(user_id="1", name="Test1", email="test1@example.com"),
+            self.User(user_id="2", name="Test2", email="test2@example.com"),
+        ]
+        self.User.insert_many(users, db_conn=mock_db)
+
+        mock_db.execute_values.assert_called_once()
+        query, row_values = mock_db.execute_values.call_args[0]
+        assert "INSERT INTO" in query
+        assert query.endswith("VALUES %s")
+        assert row_values == [
+            ("1", "Test1", "test1@example.com"),
+            ("2", "Test2", "test2@example.com"),
+        ]
+        assert mock_db.execute_values.call_args[1]["commit"] is True
+
     @patch("simpleorm.base_model.DbUtil")
     def test_update(self, mock_db_util_class):
         """Test update method."""
@@ -411,6 +517,56 @@ class TestModelDML:
         assert "UPDATE" in query_call
         assert "user" in query_call.lower()
 
+    @patch("simpleorm.base_model.DbUtil")
+    def test_update_only_dirty_columns(self, mock_db_util_class):
+        """Test update writes only columns changed since construction."""
+        mock_db = MagicMock()
+        mock_db.execute_query = MagicMock()
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        user = self.User(user_id="1", name="Test", email="test@example.com")
+        user.name = "Updated"
+        user.update(db_conn=mock_db)
+
+        query_call = mock_db.execute_query.call_args[1]["query"]
+        assert "name = %s" in query_call
+        assert "email = %s" not in query_call
+
+    @patch("simpleorm.base_model.DbUtil")
+    def test_insert_returning(self, mock_db_util_class):
+        """Test insert with RETURNING fetches rows in the same round-trip."""
+        mock_db = MagicMock()
+        mock_db.execute_query = MagicMock(
+            return_value=[{"user_id": "1", "name": "Test"}]
+        )
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        user = self.User(user_id="1", name="Test", email="test@example.com")
+        result = user.insert(db_conn=mock_db, returning=["user_id", "name"])
+
+        query_call = mock_db.execute_query.call_args[1]["query"]
+        assert "RETURNING user_id, name" in query_call
+        assert result["returned"] == [{"user_id": "1", "name": "Test"}]
+
+    @patch("simpleorm.base_model.DbUtil")
+    def test_update_batch_conditions(self, mock_db_util_class):
+        """Test update applies one SET to many rows via IN (VALUES ...)."""
+        mock_db = MagicMock()
+        mock_db.execute_query = MagicMock()
+        mock_db_util_class.return_value = mock_db
+        mock_db.connect = MagicMock()
+
+        user = self.User(user_id="1", name="Renamed", email="test@example.com")
+        user.name = "Renamed"
+        user.update(db_conn=mock_db, condition_values_batch=[("1",), ("2",)])
+
+        query_call = mock_db.execute_query.call_args[1]["query"]
+        data_call = mock_db.execute_query.call_args[1]["data"]
+        assert "(user_id) IN (VALUES (%s), (%s))" in query_call
+        assert data_call[-2:] == ("1", "2")
+
     @patch("simpleorm.base_model.DbUtil")
     def test_update_with_increment(self, mock_db_util_class):
         """Test update with increment."""
@@ -1,15 +1,184 @@
 """Tests for simpleorm.db_util."""
 
-from unittest.mock import MagicMock, patch
+import contextlib
+import importlib.util
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 import psycopg2
+from psycopg2 import sql
 
+import simpleorm.db_util
 from simpleorm.db_util import DbUtil
 
 
-class TestDbUtil:
-    """Tests for DbUtil class."""
+# Shared fixture rows: every parametrized execute_query case runs against
+# a cursor returning these two (id, name) rows.
+_ROWS = [(1, "test"), (2, "test2")]
+
+# DbUtil copies params into connection_params, so the tests can share one dict.
+DEFAULT_PARAMS = {"host": "localhost", "database": "test"}
+
+
+def _create_schema_call(schema):
+    """Expected cursor.execute call for create_schema(schema)."""
+    return call(
+        sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(schema))
+    )
+
+
+# Built once: the schema tests compare call_args against these directly.
+CALL_CREATE_SCHEMA_APP = _create_schema_call("app")
+CALL_CREATE_SCHEMA_TEST = _create_schema_call("test_schema")
+
+
+def _check_basic(result, mock_connect, mock_conn, mock_cursor):
+    assert result == _ROWS
+    mock_cursor.execute.assert_called_once_with("SELECT * FROM test")
+
+
+def _check_with_params(result, mock_connect, mock_conn, mock_cursor):
+    mock_cursor.execute.assert_called_once_with(
+        "SELECT * FROM test WHERE id = %s", (1,)
+    )
+
+
+def _check_column_names(result, mock_connect, mock_conn, mock_cursor):
+    assert result == [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}]
+
+
+def _check_no_fetch(result, mock_connect, mock_conn, mock_cursor):
+    assert result is None
+    mock_cursor.fetchmany.assert_not_called()
+
+
+def _check_commit(result, mock_connect, mock_conn, mock_cursor):
+    mock_conn.commit.assert_called_once()
+
+
+def _check_auto_connect(result, mock_connect, mock_conn, mock_cursor):
+    assert mock_connect.call_count >= 1
+
+
+def _check_as_pd(result, mock_connect, mock_conn, mock_cursor):
+    import pandas as pd
+
+    assert isinstance(result, pd.DataFrame)
+    assert list(result.columns) == ["id", "name"]
+    assert result["name"].tolist() == ["test", "test2"]
+
+
+EXECUTE_QUERY_CASES = [
+    pytest.param("SELECT * FROM test", {}, _check_basic, id="basic"),
+    pytest.param(
+        "SELECT * FROM test WHERE id = %s",
+        {"data": (1,)},
+        _check_with_params,
+        id="with_params",
+    ),
+    pytest.param(
+        "SELECT * FROM test",
+        {"get_column_names": True},
+        _check_column_names,
+        id="get_column_names",
+    ),
+    pytest.param(
+        "INSERT INTO test VALUES (1)",
+        {"no_fetch": True},
+        _check_no_fetch,
+        id="no_fetch",
+    ),
+    pytest.param(
+        "INSERT INTO test VALUES (1)",
+        {"commit": True},
+        _check_commit,
+        id="with_commit",
+    ),
+    pytest.param(
+        "SELECT 1", {"table_schema": "app"}, _check_auto_connect, id="auto_connect"
+    ),
+    pytest.param(
+        "SELECT * FROM test",
+        {"as_pd": True},
+        _check_as_pd,
+        id="as_pd",
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec("pandas") is None,
+            reason="pandas not installed",
+        ),
+    ),
+]
+
+
+def _setenv_many(monkeypatch, **env):
+    """Set several environment variables in one call."""
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+
+class _CtxCursor:
+    """Plain context manager yielding a cursor mock — replaces the
+    ``cursor.return_value.__enter__.return_value`` MagicMock dance."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self._cursor
+
+    def __exit__(self, *exc):
+        return False
+
+
+def make_conn(description=None, rows=None, execute_side_effect=None):
+    """Return a pre-wired (mock_conn, mock_cursor) pair.
+
+    spec-constrained Mocks instead of MagicMock: attribute access stays on
+    the listed names rather than autogenerating a child mock per lookup,
+    and typos in tests fail loudly.
+    """
+    mock_cursor = Mock(
+        spec=["execute", "fetchmany", "description", "copy_from", "close"]
+    )
+    if description is not None:
+        mock_cursor.description = description
+    if rows is not None:
+        mock_cursor.fetchmany.side_effect = [list(rows), []]
+    if execute_side_effect is not None:
+        mock_cursor.execute.side_effect = execute_side_effect
+    mock_conn = Mock(spec=["cursor", "commit", "rollback", "close"])
+    mock_conn.cursor.return_value = _CtxCursor(mock_cursor)
+    return mock_conn, mock_cursor
+
+
+@pytest.fixture(scope="class")
+def patched_connect():
+    """Patch psycopg.connect once per class; ``mocks`` resets it per test."""
+    with patch("simpleorm.db_util.psycopg.connect") as mock_connect:
+        yield mock_connect
+
+
+@pytest.fixture
+def bare_db():
+    """DbUtil shell built with __new__, skipping __init__'s env parsing."""
+    db = DbUtil.__new__(DbUtil)
+    db.connection = None
+    db.connection_params = {}
+    db.use_pool = False
+    return db
+
+
+@pytest.fixture
+def mocks(patched_connect):
+    """Freshly wired (mock_connect, mock_conn, mock_cursor) per test."""
+    patched_connect.reset_mock(return_value=True, side_effect=True)
+    mock_conn, mock_cursor = make_conn()
+    patched_connect.return_value = mock_conn
+    return patched_connect, mock_conn, mock_cursor
+
+
+class TestDbUtilInit:
+    """DbUtil construction and parameter resolution."""
 
     def test_init_with_params(self):
         """Test initialization with explicit parameters."""
@@ -30,11 +199,14 @@ class TestDbUtil:
 
     def test_init_with_env_vars(self, monkeypatch):
         """Test initialization falls back to environment variables."""
-        monkeypatch.setenv("DATABASE_HOST", "envhost")
-        monkeypatch.setenv("DATABASE_NAME", "envdb")
-        monkeypatch.setenv("DATABASE_USER", "envuser")
-        monkeypatch.setenv("DATABASE_PASS", "envpass")
-        monkeypatch.setenv("DATABASE_PORT", "5433")
+        _setenv_many(
+            monkeypatch,
+            DATABASE_HOST="envhost",
+            DATABASE_NAME="envdb",
+            DATABASE_USER="envuser",
+            DATABASE_PASS="envpass",
+            DATABASE_PORT="5433",
+        )
 
         db = DbUtil()
         assert db.connection_params["host"] == "envhost"
@@ -49,216 +221,323 @@ class TestDbUtil:
         db = DbUtil(params={"host": "paramhost"})
         assert db.connection_params["host"] == "paramhost"
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_connect_success(self, mock_connect):
+
+class TestDbUtilConnect:
+    """Connection lifecycle: connect, disconnect, commit, schema setup."""
+
+    def test_connect_success(self, mocks):
         """Test successful connection."""
-        mock_conn = MagicMock()
-        mock_connect.return_value = mock_conn
+        mock_connect, mock_conn, _ = mocks
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
+        db = DbUtil(params=DEFAULT_PARAMS)
         db.connect()
 
         assert db.connection == mock_conn
         mock_connect.assert_called_once()
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_connect_with_schema(self, mock_connect):
+    def test_connect_with_schema(self, mocks):
         """Test connection with default schema creates schema and sets search_path."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+        _, mock_conn, mock_cursor = mocks
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
+        simpleorm.db_util._ENSURED_SCHEMAS.clear()
+        db = DbUtil(params=DEFAULT_PARAMS)
         db.connect(default_schema="app")
 
         assert mock_conn.cursor.called
-        mock_cursor.execute.assert_called_with("CREATE SCHEMA IF NOT EXISTS app")
+        assert mock_cursor.execute.call_args == CALL_CREATE_SCHEMA_APP
         assert db.connection_params["options"] == "-c search_path=app"
         assert db.connection == mock_conn
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_connect_failure(self, mock_connect):
+        # a second connection to the same schema skips the CREATE round-trip
+        mock_cursor.execute.reset_mock()
+        db.connect(default_schema="app")
+        mock_cursor.execute.assert_not_called()
+
+    def test_connect_failure(self, mocks):
         """Test connection failure raises RuntimeError."""
+        mock_connect, _, _ = mocks
         mock_connect.side_effect = psycopg2.OperationalError("Connection failed")
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
+        db = DbUtil(params=DEFAULT_PARAMS)
         with pytest.raises(RuntimeError, match="Failed to create DB Connection"):
             db.connect()
 
-    def test_disconnect_with_commit(self):
-        """Test disconnect with commit."""
+    @patch("simpleorm.db_util.ThreadedConnectionPool")
+    def test_connect_with_pool(self, mock_pool_class):
+        """Test pooled connect checks out and disconnect returns the connection."""
+        mock_pool = MagicMock()
         mock_conn = MagicMock()
-        db = DbUtil()
-        db.connection = mock_conn
+        mock_pool.getconn.return_value = mock_conn
+        mock_pool_class.return_value = mock_pool
+
+        db = DbUtil(
+            params={"host": "poolhost", "database": "pooldb"}, use_pool=True
+        )
+        db.connect()
+
+        assert db.connection == mock_conn
+        mock_pool.getconn.assert_called_once()
+
+        db.disconnect()
+
+        mock_pool.putconn.assert_called_once_with(mock_conn, close=False)
+        mock_conn.close.assert_not_called()
+        assert db.connection is None
+
+    @patch("simpleorm.db_util.ThreadedConnectionPool")
+    def test_pooled_disconnect_discards_connection_on_reset_failure(
+        self, mock_pool_class
+    ):
+        """Test a failed pool reset still returns (and closes) the connection."""
+        mock_pool = MagicMock()
+        mock_conn, mock_cursor = make_conn(
+            execute_side_effect=psycopg2.OperationalError("aborted transaction")
+        )
+        mock_pool.getconn.return_value = mock_conn
+        mock_pool_class.return_value = mock_pool
+
+        db = DbUtil(
+            params={"host": "resethost", "database": "resetdb"}, use_pool=True
+        )
+        db.connect()
+        db._stmt_cache["SELECT 1"] = ["s_1", None]
+
+        db.disconnect()
+
+        mock_conn.rollback.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(mock_conn, close=True)
+        assert db.connection is None
+
+    @patch("simpleorm.db_util.ThreadedConnectionPool")
+    def test_pooled_connect_with_schema_releases_setup_connection(
+        self, mock_pool_class
+    ):
+        """Test the CREATE SCHEMA checkout goes back to its own pool."""
+        # the setup connection comes from the pool keyed without the
+        # search_path options, the final one from the options-keyed pool
+        setup_pool, final_pool = MagicMock(), MagicMock()
+        setup_conn, setup_cursor = make_conn()
+        final_conn, _ = make_conn()
+        setup_pool.getconn.return_value = setup_conn
+        final_pool.getconn.return_value = final_conn
+        mock_pool_class.side_effect = [setup_pool, final_pool]
+
+        simpleorm.db_util._ENSURED_SCHEMAS.clear()
+        db = DbUtil(
+            params={"host": "schemapoolhost", "database": "schemapooldb"},
+            use_pool=True,
+        )
+        db.connect(default_schema="app")
+
+        assert setup_cursor.execute.call_args == CALL_CREATE_SCHEMA_APP
+        setup_pool.putconn.assert_called_once_with(setup_conn, close=False)
+        assert db.connection is final_conn
+
+    def test_disconnect_with_commit(self, bare_db):
+        """Test disconnect with commit."""
+        mock_conn, _ = make_conn()
+        bare_db.connection = mock_conn
+        db = bare_db
 
         db.disconnect(do_commit=True)
 
         mock_conn.commit.assert_called_once()
         mock_conn.close.assert_called_once()
 
-    def test_disconnect_without_commit(self):
+    def test_disconnect_without_commit(self, bare_db):
         """Test disconnect without commit."""
-        mock_conn = MagicMock()
-        db = DbUtil()
-        db.connection = mock_conn
+        mock_conn, _ = make_conn()
+        bare_db.connection = mock_conn
+        db = bare_db
 
         db.disconnect(do_commit=False)
 
         mock_conn.commit.assert_not_called()
         mock_conn.close.assert_called_once()
 
-    def test_disconnect_no_connection(self):
-        """Test disconnect when no connection exists."""
-        db = DbUtil()
-        db.disconnect()
-        assert db.connection is None
-
-    def test_commit_success(self):
+    def test_commit_success(self, bare_db):
         """Test successful commit."""
-        mock_conn = MagicMock()
-        db = DbUtil()
-        db.connection = mock_conn
+        mock_conn, _ = make_conn()
+        bare_db.connection = mock_conn
+        db = bare_db
 
         db.commit()
 
         mock_conn.commit.assert_called_once()
 
-    def test_commit_no_connection(self):
-        """Test commit raises when no connection exists."""
-        db = DbUtil()
-        with pytest.raises(RuntimeError, match="No connection found"):
-            db.commit()
-
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_create_schema_success(self, mock_connect):
+    @pytest.mark.parametrize(
+        ("method", "raises"), [("disconnect", False), ("commit", True)]
+    )
+    def test_no_connection(self, bare_db, method, raises):
+        """Test disconnect is a no-op and commit raises without a connection."""
+        expectation = (
+            pytest.raises(RuntimeError, match="No connection found")
+            if raises
+            else contextlib.nullcontext()
+        )
+        with expectation:
+            getattr(bare_db, method)()
+        assert bare_db.connection is None
+
+    def test_create_schema_success(self, mocks):
         """Test successful schema creation."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+        _, mock_conn, mock_cursor = mocks
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
+        db = DbUtil(params=DEFAULT_PARAMS)
         db.create_schema("test_schema")
 
-        mock_cursor.execute.assert_called_with("CREATE SCHEMA IF NOT EXISTS test_schema")
+        assert mock_cursor.execute.call_args == CALL_CREATE_SCHEMA_TEST
         mock_conn.commit.assert_called_once()
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_create_schema_failure(self, mock_connect):
+    def test_create_schema_failure(self, mocks):
         """Test schema creation failure raises RuntimeError."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        _, mock_conn, mock_cursor = mocks
         mock_cursor.execute.side_effect = psycopg2.ProgrammingError("Schema error")
-        mock_connect.return_value = mock_conn
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
+        db = DbUtil(params=DEFAULT_PARAMS)
         with pytest.raises(RuntimeError, match="Failed to create Schema"):
             db.create_schema("test_schema")
 
         mock_conn.rollback.assert_called_once()
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_execute_query_basic(self, mock_connect):
-        """Test basic query execution."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.description = [("id",), ("name",)]
-        mock_cursor.fetchall.return_value = [(1, "test"), (2, "test2")]
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
-
-        db = DbUtil(params={"host": "localhost", "database": "test"})
-        result = db.execute_query("SELECT * FROM test")
 
-        assert result == [(1, "test"), (2, "test2")]
-        mock_cursor.execute.assert_called_once_with("SELECT * FROM test")
-
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_execute_query_with_params(self, mock_connect):
-        """Test query execution with parameters."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.description = [("id",)]
-        mock_cursor.fetchall.return_value = [(1,)]
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+class TestDbUtilQuery:
+    """Query execution and bulk-load paths."""
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
-        result = db.execute_query("SELECT * FROM test WHERE id = %s", data=(1,))
+    @pytest.mark.parametrize(("query", "kwargs", "check"), EXECUTE_QUERY_CASES)
+    def test_execute_query(self, mocks, query, kwargs, check):
+        """Test execute_query across its kwargs; ``check`` holds each assertion."""
+        mock_connect, mock_conn, mock_cursor = mocks
+        mock_cursor.description = [("id",), ("name",)]
+        mock_cursor.fetchmany.side_effect = [list(_ROWS), []]
 
-        mock_cursor.execute.assert_called_once_with("SELECT * FROM test WHERE id = %s", (1,))
+        db = DbUtil(params=DEFAULT_PARAMS)
+        result = db.execute_query(query, **kwargs)
 
+        check(result, mock_connect, mock_conn, mock_cursor)
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_execute_query_get_column_names(self, mock_connect):
-        """Test query execution returning list of dicts."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
+    def test_execute_query_as_namedtuples(self, mocks):
+        """Test query execution returning cached namedtuple rows."""
+        _, _, mock_cursor = mocks
         mock_cursor.description = [("id",), ("name",)]
-        mock_cursor.fetchall.return_value = [(1, "test"), (2, "test2")]
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+        mock_cursor.fetchmany.side_effect = [[(1, "test"), (2, "test2")], []]
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
-        result = db.execute_query("SELECT * FROM test", get_column_names=True)
+        db = DbUtil(params=DEFAULT_PARAMS)
+        result = db.execute_query("SELECT * FROM test", as_namedtuples=True)
 
-        assert result == [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}]
+        assert result[0].id == 1
+        assert result[1].name == "test2"
+        # row class is cached per result shape
+        assert db._rowclass_cache[("id", "name")] is type(result[0])
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_execute_query_no_fetch(self, mock_connect):
-        """Test query execution without fetching results."""
-        mock_conn = MagicMock()
+    def test_execute_query_stream(self, mocks):
+        """Test streaming returns a generator over a named server-side cursor."""
+        _, mock_conn, _ = mocks
         mock_cursor = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+        mock_cursor.__iter__.return_value = iter([(1,), (2,)])
+        mock_conn.cursor.return_value = mock_cursor
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
-        result = db.execute_query("INSERT INTO test VALUES (1)", no_fetch=True)
+        db = DbUtil(params=DEFAULT_PARAMS)
+        db.connect()
+        rows = db.execute_query("SELECT * FROM test", stream=True, fetch_size=500)
 
-        assert result is None
-        mock_cursor.fetchall.assert_not_called()
+        assert list(rows) == [(1,), (2,)]
+        assert "name" in mock_conn.cursor.call_args[1]
+        assert mock_cursor.itersize == 500
+        mock_cursor.close.assert_called_once()
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_execute_query_with_commit(self, mock_connect):
-        """Test query execution with commit."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
+    def test_execute_query_prepared_statement_cache(self, mocks):
+        """Test repeated parameterized queries PREPARE once then EXECUTE."""
+        _, _, mock_cursor = mocks
         mock_cursor.description = [("id",)]
-        mock_cursor.fetchall.return_value = [(1,)]
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+        mock_cursor.fetchmany.side_effect = [[(1,)], [], [(2,)], []]
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
-        db.execute_query("INSERT INTO test VALUES (1)", commit=True)
+        db = DbUtil(
+            params=DEFAULT_PARAMS,
+            statement_cache_size=10,
+        )
+        db.connect()
+        db.execute_query("SELECT * FROM test WHERE id = %s", data=(1,))
+        db.execute_query("SELECT * FROM test WHERE id = %s", data=(2,))
+
+        executed = [c.args for c in mock_cursor.execute.call_args_list]
+        assert executed[0] == ("PREPARE s_1 AS SELECT * FROM test WHERE id = $1",)
+        assert executed[1] == ("EXECUTE s_1 (%s)", (1,))
+        # second call reuses the prepared statement without a new PREPARE
+        assert executed[2] == ("EXECUTE s_1 (%s)", (2,))
+        assert len(executed) == 3
+
+    def test_execute_query_prepared_without_params(self, mocks):
+        """Test an empty data tuple EXECUTEs without a parameter list."""
+        _, _, mock_cursor = mocks
+        mock_cursor.description = [("id",)]
+        mock_cursor.fetchmany.side_effect = [[(1,)], []]
 
+        db = DbUtil(
+            params=DEFAULT_PARAMS,
+            statement_cache_size=10,
+        )
+        db.connect()
+        db.execute_query("SELECT * FROM test", data=())
+
+        executed = [c.args for c in mock_cursor.execute.call_args_list]
+        assert executed[0] == ("PREPARE s_1 AS SELECT * FROM test",)
+        # EXECUTE s_1 () would be a PostgreSQL syntax error
+        assert executed[1] == ("EXECUTE s_1",)
+
+    def test_insert_unnest(self, mocks):
+        """Test insert_unnest sends each column as one array parameter."""
+        _, _, mock_cursor = mocks
+
+        db = DbUtil(params=DEFAULT_PARAMS)
+        db.insert_unnest(
+            "users",
+            ["id", "name"],
+            {"id": [1, 2], "name": ["test", "test2"]},
+            column_types={"id": "int4"},
+        )
+
+        query, data = mock_cursor.execute.call_args.args
+        assert query == (
+            "INSERT INTO users (id, name) SELECT * FROM UNNEST(%s::int4[], %s)"
+        )
+        assert data == ([1, 2], ["test", "test2"])
+
+    def test_bulk_copy(self, mocks):
+        """Test bulk_copy streams rows to COPY FROM STDIN in text format."""
+        _, mock_conn, mock_cursor = mocks
+
+        db = DbUtil(params=DEFAULT_PARAMS)
+        db.bulk_copy(
+            "users", ["id", "name"], [(1, "test"), (2, None)], commit=True
+        )
+
+        buffer = mock_cursor.copy_from.call_args.args[0]
+        assert buffer.getvalue() == "1\ttest\n2\t\\N\n"
+        assert mock_cursor.copy_from.call_args.args[1] == "users"
+        assert mock_cursor.copy_from.call_args.kwargs["columns"] == ["id", "name"]
         mock_conn.commit.assert_called_once()
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_execute_query_auto_connect(self, mock_connect):
-        """Test query execution auto-connects if no connection exists."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.description = [("id",)]
-        mock_cursor.fetchall.return_value = [(1,)]
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+    def test_copy_from_dataframe(self, mocks):
+        """Test copy_from_dataframe serializes the frame and COPYs it."""
+        pd = pytest.importorskip("pandas")
+
+        _, mock_conn, mock_cursor = mocks
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
-        db.execute_query("SELECT 1", table_schema="app")
+        db = DbUtil(params=DEFAULT_PARAMS)
+        df = pd.DataFrame({"id": [1, 2], "name": ["test", "test2"]})
+        db.copy_from_dataframe(df, "users")
 
-        assert mock_connect.call_count >= 1
+        buffer = mock_cursor.copy_from.call_args.args[0]
+        assert buffer.getvalue() == "1\ttest\n2\ttest2\n"
+        assert mock_cursor.copy_from.call_args.kwargs["columns"] == ["id", "name"]
+        mock_conn.commit.assert_not_called()
 
-    @patch("simpleorm.db_util.psycopg.connect")
-    def test_execute_query_failure(self, mock_connect):
+    def test_execute_query_failure(self, mocks):
         """Test query execution failure raises exception."""
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
+        _, _, mock_cursor = mocks
         mock_cursor.execute.side_effect = psycopg2.ProgrammingError("SQL error")
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
 
-        db = DbUtil(params={"host": "localhost", "database": "test"})
+        db = DbUtil(params=DEFAULT_PARAMS)
         with pytest.raises(psycopg2.ProgrammingError):
             db.execute_query("INVALID SQL")
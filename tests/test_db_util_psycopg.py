@@ -0,0 +1,111 @@
+"""Tests for simpleorm.db_util_psycopg."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from simpleorm.db_util_psycopg import PsycopgDbUtil
+
+DEFAULT_PARAMS = {"host": "localhost", "database": "test"}
+
+
+def make_conn():
+    """Return a pre-wired (mock_conn, mock_cursor) pair."""
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+    return mock_conn, mock_cursor
+
+
+class TestPsycopgDbUtil:
+    """Tests for PsycopgDbUtil class."""
+
+    def test_init_without_psycopg3(self):
+        """Test initialization raises when psycopg 3 is not installed."""
+        with patch("simpleorm.db_util_psycopg.psycopg3", None):
+            with pytest.raises(RuntimeError, match="psycopg \\(v3\\) is required"):
+                PsycopgDbUtil(params=DEFAULT_PARAMS)
+
+    def test_connect_with_prepare_threshold(self):
+        """Test connect passes prepare_threshold and bounds prepared_max."""
+        mock_conn, _ = make_conn()
+        with patch("simpleorm.db_util_psycopg.psycopg3") as mock_psycopg3:
+            mock_psycopg3.connect.return_value = mock_conn
+            db = PsycopgDbUtil(params=DEFAULT_PARAMS)
+            db.connect(prepare_threshold=5, prepared_max=100)
+
+        assert db.connection is mock_conn
+        connect_kwargs = mock_psycopg3.connect.call_args.kwargs
+        assert connect_kwargs["prepare_threshold"] == 5
+        assert connect_kwargs["host"] == "localhost"
+        assert connect_kwargs["dbname"] == "test"
+        assert mock_conn.prepared_max == 100
+
+    def test_disconnect_with_commit(self):
+        """Test disconnect commits before closing when asked to."""
+        mock_conn, _ = make_conn()
+        with patch("simpleorm.db_util_psycopg.psycopg3"):
+            db = PsycopgDbUtil(params=DEFAULT_PARAMS)
+            db.connection = mock_conn
+
+            db.disconnect(do_commit=True)
+
+        mock_conn.commit.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    def test_disconnect_commit_failure_still_closes(self):
+        """Test a failed commit on disconnect is logged and close still runs."""
+        mock_conn, _ = make_conn()
+        with patch("simpleorm.db_util_psycopg.psycopg3") as mock_psycopg3:
+            mock_psycopg3.Error = type("Error", (Exception,), {})
+            db = PsycopgDbUtil(params=DEFAULT_PARAMS)
+            db.connection = mock_conn
+            mock_conn.commit.side_effect = mock_psycopg3.Error("commit failed")
+
+            db.disconnect(do_commit=True)
+
+        mock_conn.close.assert_called_once()
+
+    def test_execute_query_with_params(self):
+        """Test query execution with %s placeholders and dict rows."""
+        mock_conn, mock_cursor = make_conn()
+        mock_cursor.description = [("id",), ("name",)]
+        mock_cursor.fetchall.return_value = [(1, "test")]
+        with patch("simpleorm.db_util_psycopg.psycopg3"):
+            db = PsycopgDbUtil(params=DEFAULT_PARAMS)
+        db.connection = mock_conn
+
+        result = db.execute_query(
+            "SELECT * FROM test WHERE id = %s", data=(1,), get_column_names=True
+        )
+
+        mock_cursor.execute.assert_called_once_with(
+            "SELECT * FROM test WHERE id = %s", (1,)
+        )
+        assert result == [{"id": 1, "name": "test"}]
+
+    def test_execute_many_uses_pipeline(self):
+        """Test execute_many batches the statements inside one pipeline."""
+        mock_conn, mock_cursor = make_conn()
+        with patch("simpleorm.db_util_psycopg.psycopg3"):
+            db = PsycopgDbUtil(params=DEFAULT_PARAMS)
+        db.connection = mock_conn
+
+        db.execute_many(
+            "INSERT INTO test VALUES (%s)", [(1,), (2,)], commit=True
+        )
+
+        mock_conn.pipeline.assert_called_once()
+        mock_cursor.executemany.assert_called_once_with(
+            "INSERT INTO test VALUES (%s)", [(1,), (2,)]
+        )
+        mock_conn.commit.assert_called_once()
+
+    def test_pipeline_returns_connection_pipeline(self):
+        """Test pipeline() hands back the connection's pipeline context."""
+        mock_conn, _ = make_conn()
+        with patch("simpleorm.db_util_psycopg.psycopg3"):
+            db = PsycopgDbUtil(params=DEFAULT_PARAMS)
+        db.connection = mock_conn
+
+        assert db.pipeline() is mock_conn.pipeline.return_value